@@ -46,7 +46,7 @@ from datetime import datetime
 from pathlib import Path
 from git import Repo
 
-sys.path.insert(0, os.path.relpath("../"))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from perceval import PMetadata
 
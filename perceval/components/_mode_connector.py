@@ -89,7 +89,8 @@ class ModeConnector:
         if self._r_is_component:
             return list(range(self._n_modes_to_connect))
         r_list = list(range(self._ro.circuit_size))
-        return [x for x in r_list if x not in self._ro.heralds.keys()]
+        heralds = self._ro._get_heralds()
+        return [x for x in r_list if x not in heralds]
 
     def resolve(self) -> Dict[int, int]:
         """
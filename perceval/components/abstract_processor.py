@@ -65,6 +65,7 @@ class AProcessor(ABC):
     def _reset_circuit(self):
         self._in_ports: Dict = {}
         self._out_ports: Dict = {}
+        self._ports_changed()
         self._postselect: Union[PostSelect, None] = None
 
         self._is_unitary: bool = True
@@ -118,6 +119,13 @@ class AProcessor(ABC):
         # Can be used by child class
         pass
 
+    def _ports_changed(self):
+        # Invalidate the lookups lazily computed from the port lists
+        self._in_port_by_mode: Union[Dict[int, APort], None] = None
+        self._out_port_by_mode: Union[Dict[int, APort], None] = None
+        self._heralds: Union[Dict[int, int], None] = None
+        self._herald_modes: Union[List[int], None] = None
+
     def min_detected_photons_filter(self, n: int):
         r"""
         Sets-up a state post-selection on the number of detected photons. With thresholded detectors, this will
@@ -151,8 +159,10 @@ class AProcessor(ABC):
         pass
 
     def postprocess_output(self, s: BasicState, keep_herald: bool = False) -> BasicState:
-        if not keep_herald and self.heralds:
-            s = s.remove_modes(list(self.heralds.keys()))
+        if not keep_herald and self._get_heralds():
+            if self._herald_modes is None:
+                self._herald_modes = list(self._get_heralds().keys())
+            s = s.remove_modes(self._herald_modes)
         if self._thresholded_output:
             s = s.threshold_detection()
         return s
@@ -183,7 +193,7 @@ class AProcessor(ABC):
         """
         Computes if the state is selected given heralds and post selection function
         """
-        for m, v in self.heralds.items():
+        for m, v in self._get_heralds().items():
             if state[m] != v:
                 return False
         if self._postselect is not None:
@@ -193,9 +203,15 @@ class AProcessor(ABC):
     def copy(self, subs: Union[dict, list] = None):
         get_logger().debug(f"Copy processor {self.name}", channel.general)
         new_proc = copy.copy(self)
+        # Only the containers which are updated in place need their own copy
+        new_proc._parameters = copy.copy(self._parameters)
+        new_proc._postselect = copy.copy(self._postselect)
+        new_proc._in_ports = copy.copy(self._in_ports)
+        new_proc._out_ports = copy.copy(self._out_ports)
         new_proc._components = []
         for r, c in self._components:
             new_proc._components.append((r, c.copy(subs=subs)))
+        new_proc._circuit_changed()
         return new_proc
 
     def set_circuit(self, circuit: ACircuit):
@@ -209,6 +225,7 @@ class AProcessor(ABC):
         self._components = []
         for r, c in circuit:
             self._components.append((r, c))
+        self._circuit_changed()
         return self
 
     def add(self, mode_mapping, component, keep_port=True):
@@ -280,6 +297,7 @@ class AProcessor(ABC):
                 port = self.get_output_port(i)
                 if port is not None:
                     del self._out_ports[port]
+                    self._ports_changed()
 
         # Compute new herald positions
         n_new_heralds = connector.add_heralded_modes(mode_mapping)
@@ -300,8 +318,9 @@ class AProcessor(ABC):
                 self._components.pop(-1)
             else:
                 new_components.append((perm_modes, perm_component))
+        first_mode = min(mode_mapping)
         for pos, c in processor.components:
-            pos = [x + min(mode_mapping) for x in pos]
+            pos = [x + first_mode for x in pos]
             new_components.append((pos, c))
         if perm_component is not None:
             perm_inv = perm_component.copy()
@@ -312,8 +331,10 @@ class AProcessor(ABC):
         self._components += new_components
 
         # Retrieve ports from the other processor
+        # The mapping is completed with heralded modes at this point, and it is one-to-one
+        inv_mapping = {v: k for k, v in mode_mapping.items()}
         for port, port_range in processor._out_ports.items():
-            port_mode = list(mode_mapping.keys())[list(mode_mapping.values()).index(port_range[0])]
+            port_mode = inv_mapping[port_range[0]]
             if isinstance(port, Herald):
                 self._add_herald(port_mode, port.expected, port.user_given_name)
             else:
@@ -356,6 +377,7 @@ class AProcessor(ABC):
             self._anon_herald_num += 1
         self._in_ports[Herald(expected, name)] = [mode]
         self._out_ports[Herald(expected, name)] = [mode]
+        self._ports_changed()
         self._circuit_changed()
 
     def add_herald(self, mode: int, expected: int, name: str = None):
@@ -475,6 +497,7 @@ class AProcessor(ABC):
             if not self.are_modes_free(port_range, PortLocation.OUTPUT):
                 raise UnavailableModeException(port_range, "Another port overlaps")
             self._out_ports[port] = port_range
+        self._ports_changed()
         return self
 
     @staticmethod
@@ -486,6 +509,7 @@ class AProcessor(ABC):
         return False
 
     def remove_port(self, m, location: PortLocation = PortLocation.IN_OUT):
+        self._ports_changed()
         if location in (PortLocation.IN_OUT, PortLocation.INPUT):
             if not AProcessor._find_and_remove_port_from_list(m, self._in_ports):
                 raise UnavailableModeException(m, f"Port is not at location '{location.name}'")
@@ -525,17 +549,23 @@ class AProcessor(ABC):
                     return False
         return True
 
+    @staticmethod
+    def _port_by_mode(port_list) -> Dict[int, APort]:
+        result = {}
+        for port, mode_range in port_list.items():
+            for m in mode_range:
+                result.setdefault(m, port)
+        return result
+
     def get_input_port(self, mode):
-        for port, mode_range in self._in_ports.items():
-            if mode in mode_range:
-                return port
-        return None
+        if self._in_port_by_mode is None:
+            self._in_port_by_mode = self._port_by_mode(self._in_ports)
+        return self._in_port_by_mode.get(mode)
 
     def get_output_port(self, mode):
-        for port, mode_range in self._out_ports.items():
-            if mode in mode_range:
-                return port
-        return None
+        if self._out_port_by_mode is None:
+            self._out_port_by_mode = self._port_by_mode(self._out_ports)
+        return self._out_port_by_mode.get(mode)
 
     def thresholded_output(self, value: bool):
         r"""
@@ -552,11 +582,14 @@ class AProcessor(ABC):
 
     @property
     def heralds(self):
-        pos = {}
-        for port, port_range in self._out_ports.items():
-            if isinstance(port, Herald):
-                pos[port_range[0]] = port.expected
-        return pos
+        return dict(self._get_heralds())
+
+    def _get_heralds(self) -> Dict[int, int]:
+        # Cached {mode: expected photon count} herald map, shared with internal callers: it must not be modified
+        if self._heralds is None:
+            self._heralds = {port_range[0]: port.expected for port, port_range in self._out_ports.items()
+                             if isinstance(port, Herald)}
+        return self._heralds
 
     def _with_logical_input(self, input_state: LogicalState):
         input_state = get_basic_state_from_ports(list(self._in_ports.keys()), input_state)
@@ -582,11 +615,12 @@ class AProcessor(ABC):
         input_list = [0] * self.circuit_size
         input_idx = 0
         expected_photons = 0
+        heralds = self._get_heralds()
         # Build real input state (merging ancillas + expected input) and compute expected photon count
         for k in range(self.circuit_size):
-            if k in self.heralds:
-                input_list[k] = self.heralds[k]
-                expected_photons += self.heralds[k]
+            if k in heralds:
+                input_list[k] = heralds[k]
+                expected_photons += heralds[k]
             else:
                 input_list[k] = input_state[input_idx]
                 expected_photons += input_state[input_idx]
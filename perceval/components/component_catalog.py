@@ -27,22 +27,36 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from __future__ import annotations
+
 import importlib
+import os
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List
+from functools import cached_property
+from types import MappingProxyType
+from typing import List, TYPE_CHECKING
 
 from perceval.utils import Parameter
-from perceval.components import Processor, Circuit
 from perceval.utils.logging import get_logger, channel
 
 
+if TYPE_CHECKING:
+    from perceval.components import Processor, Circuit
+
+
 class AsType(Enum):
     CIRCUIT = 0
     PROCESSOR = 1
 
 
 class CatalogItem(ABC):
+    # Shared read-only default build options, child classes may override it
+    _DEFAULT_OPTS = MappingProxyType({
+        'type': AsType.PROCESSOR,
+        'backend': 'SLOS'
+    })
+
     article_ref = None
     description = None
     str_repr = None
@@ -51,14 +65,10 @@ class CatalogItem(ABC):
 
     def __init__(self, name: str):
         self._name = name
-        self._default_opts = {
-            'type': AsType.PROCESSOR,
-            'backend': 'SLOS'
-        }
         self._reset_opts()
 
     def _reset_opts(self):
-        self._build_opts = self._default_opts.copy()
+        self._build_opts = dict(self._DEFAULT_OPTS)
 
     def as_circuit(self):
         self._build_opts['type'] = AsType.CIRCUIT
@@ -71,9 +81,7 @@ class CatalogItem(ABC):
         return self
 
     def _opt(self, key):
-        if key in self._build_opts:
-            return self._build_opts[key]
-        return self._default_opts[key] if key in self._default_opts else None
+        return self._build_opts.get(key, self._DEFAULT_OPTS.get(key))
 
     @property
     def name(self) -> str:
@@ -83,26 +91,22 @@ class CatalogItem(ABC):
         """
         return self._name
 
-    @property
+    @cached_property
     def doc(self):
-        content = ''
+        parts = []
         if self.description:
-            content += f'\n{self.description}\n'
+            parts.append(f'\n{self.description}\n')
         if self.article_ref:
-            content += f'\nScientific article reference: {self.article_ref}\n'
+            parts.append(f'\nScientific article reference: {self.article_ref}\n')
         if self.str_repr:
-            content += f'\nSchema:\n{self.str_repr}\n'
+            parts.append(f'\nSchema:\n{self.str_repr}\n')
         if self.params_doc:
-            content += '\nParameters:\n'
-            for param_name, param_descr in self.params_doc.items():
-                content += f' * {param_name}: {param_descr}\n'
+            parts.append('\nParameters:\n')
+            parts.extend(f' * {param_name}: {param_descr}\n' for param_name, param_descr in self.params_doc.items())
         if self.see_also:
-            content += f'\nSee also: {self.see_also}\n'
-        if content == '':
-            content = 'None'
+            parts.append(f'\nSee also: {self.see_also}\n')
         title = f'{self._name} documentation\n'.upper()
-        title += '-' * len(title) + '\n'
-        return title + content
+        return "".join([title, '-' * len(title), '\n'] + (parts or ['None']))
 
     # @abstractmethod was removed and build method deprecated in all child classes
     # The goal is to get rid of the overkill builder pattern and use build_processor and build_circuit instead
@@ -116,6 +120,7 @@ class CatalogItem(ABC):
         return value
 
     def _init_processor(self, **kwargs):
+        from perceval.components.processor import Processor
         return Processor(kwargs.get("backend", "SLOS"), self.build_circuit(**kwargs),
                          name=kwargs.get("name") or self._name.upper())
 
@@ -141,11 +146,28 @@ class CatalogItem(ABC):
 
 class Catalog:
     def __init__(self, path: str):
-        self._items = {}
+        self._items = {}  # Item name -> CatalogItem instance, or None while the item has not been loaded yet
+        self._pending = {}  # Item name -> (module path, class name) of items which have not been loaded yet
         if path:
             self.add_path(path)
 
     def add_path(self, path):
+        try:
+            manifest = importlib.import_module(f"{path}._manifest")
+        except ModuleNotFoundError as e:
+            if e.name != f"{path}._manifest":
+                raise
+            manifest = None
+        if manifest is not None and hasattr(manifest, 'catalog_manifest'):
+            # Lazy registration: item modules are imported on first access only
+            for name, (module_name, class_name) in manifest.catalog_manifest.items():
+                self._items[name] = None
+                self._pending[name] = (f"{path}.{module_name}", class_name)
+            if os.environ.get('EAGER_IMPORT'):
+                for name in list(self._pending):
+                    self._load_item(name)
+            return
+
         module = importlib.import_module(path)
         if 'catalog_items' in dir(module):
             sub_catalog = getattr(module, 'catalog_items')
@@ -158,6 +180,13 @@ class Catalog:
             obj = cls()
             if isinstance(obj, CatalogItem):
                 self._items[obj.name] = obj
+                self._pending.pop(obj.name, None)
+
+    def _load_item(self, item_name: str) -> CatalogItem:
+        module_path, class_name = self._pending.pop(item_name)
+        obj = getattr(importlib.import_module(module_path), class_name)()
+        self._items[item_name] = obj
+        return obj
 
     def list(self) -> List[str]:
         return list(self._items.keys())
@@ -166,4 +195,7 @@ class Catalog:
         return item in self._items
 
     def __getitem__(self, item_name: str) -> CatalogItem:
-        return self._items[item_name]
+        item = self._items[item_name]
+        if item is None:
+            item = self._load_item(item_name)
+        return item
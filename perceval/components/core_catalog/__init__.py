@@ -27,16 +27,40 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from .klm_cnot import KLMCnotItem
-from .postprocessed_cnot import PostProcessedCnotItem
-from .heralded_cnot import HeraldedCnotItem
-from .heralded_cz import HeraldedCzItem
-from .generic_2mode import Generic2ModeItem
-from .mzi import MZIPhaseFirst, MZIPhaseLast
-from .postprocessed_ccz import PostProcessedCCZItem
-from .toffoli import ToffoliItem
-from .controlled_rotation_gates  import PostProcessedControledRotationsItem
-
-catalog_items = [KLMCnotItem, HeraldedCnotItem, PostProcessedCnotItem, HeraldedCzItem, Generic2ModeItem, MZIPhaseFirst,
-                 MZIPhaseLast, PostProcessedCCZItem, ToffoliItem, PostProcessedControledRotationsItem
-]
+import importlib
+from typing import TYPE_CHECKING
+
+from ._manifest import catalog_manifest
+
+if TYPE_CHECKING:
+    from .klm_cnot import KLMCnotItem
+    from .postprocessed_cnot import PostProcessedCnotItem
+    from .heralded_cnot import HeraldedCnotItem
+    from .heralded_cz import HeraldedCzItem
+    from .generic_2mode import Generic2ModeItem
+    from .mzi import MZIPhaseFirst, MZIPhaseLast
+    from .postprocessed_ccz import PostProcessedCCZItem
+    from .toffoli import ToffoliItem
+    from .controlled_rotation_gates import PostProcessedControledRotationsItem
+
+_class_modules = {class_name: module_name for module_name, class_name in catalog_manifest.values()}
+
+
+def _load_class(class_name: str):
+    module = importlib.import_module(f".{_class_modules[class_name]}", __name__)
+    return getattr(module, class_name)
+
+
+def __getattr__(name: str):
+    # Catalog item modules are only imported when one of their classes is accessed (PEP 562)
+    if name in _class_modules:
+        cls = _load_class(name)
+        globals()[name] = cls
+        return cls
+    if name == "catalog_items":
+        return [_load_class(class_name) for _, class_name in catalog_manifest.values()]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_class_modules) + ["catalog_items"])
@@ -0,0 +1,43 @@
+# MIT License
+#
+# Copyright (c) 2022 Quandela
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# As a special exception, the copyright holders of exqalibur library give you
+# permission to combine exqalibur with code included in the standard release of
+# Perceval under the MIT license (or modified versions of such code). You may
+# copy and distribute such a combined system following the terms of the MIT
+# license for both exqalibur and Perceval. This exception for the usage of
+# exqalibur is limited to the python bindings used by Perceval.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Lightweight description of the catalog content: item name -> (module name, class name)
+# Listing the catalog relies on this manifest only, item modules are imported on first access.
+catalog_manifest = {
+    "klm cnot": ("klm_cnot", "KLMCnotItem"),
+    "heralded cnot": ("heralded_cnot", "HeraldedCnotItem"),
+    "postprocessed cnot": ("postprocessed_cnot", "PostProcessedCnotItem"),
+    "heralded cz": ("heralded_cz", "HeraldedCzItem"),
+    "generic 2 mode circuit": ("generic_2mode", "Generic2ModeItem"),
+    "mzi phase first": ("mzi", "MZIPhaseFirst"),
+    "mzi phase last": ("mzi", "MZIPhaseLast"),
+    "postprocessed ccz": ("postprocessed_ccz", "PostProcessedCCZItem"),
+    "toffoli": ("toffoli", "ToffoliItem"),
+    "postprocessed controlled gate": ("controlled_rotation_gates", "PostProcessedControledRotationsItem"),
+}
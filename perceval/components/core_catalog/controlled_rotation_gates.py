@@ -35,7 +35,7 @@ import cmath as cm
 from scipy.linalg import block_diag
 
 from perceval.components import Circuit, Port, Unitary
-from perceval.components.component_catalog import CatalogItem, AsType
+from perceval.components.component_catalog import CatalogItem
 from perceval.utils import Encoding, PostSelect, Matrix
 
 
@@ -92,7 +92,6 @@ ctrlN (dual rail)  ─────┤     ├───── ctrlN (dual rail)
 
     def __init__(self):
         super().__init__("postprocessed controlled gate")
-        self._default_opts['type'] = AsType.PROCESSOR
 
     def build_circuit(self, **kwargs):
         """
@@ -27,6 +27,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from types import MappingProxyType
+
 from perceval.components import Processor, Circuit, BS
 from perceval.components.component_catalog import CatalogItem, AsType
 from perceval.utils.parameter import P
@@ -34,6 +36,11 @@ from perceval.utils.logging import deprecated
 
 
 class Generic2ModeItem(CatalogItem):
+    _DEFAULT_OPTS = MappingProxyType({
+        'type': AsType.CIRCUIT,
+        'backend': 'SLOS'
+    })
+
     description = "A universal 2 mode component, implemented as a beam splitter with variable theta + 3 free phases"
     str_repr = r"""    ╭──────╮╭─────╮╭──────╮
 0:──┤phi_tl├┤     ├┤phi_tr├──:0
@@ -50,8 +57,6 @@ class Generic2ModeItem(CatalogItem):
 
     def __init__(self):
         super().__init__("generic 2 mode circuit")
-        self._default_opts['type'] = AsType.CIRCUIT
-        self._reset_opts()
 
     @deprecated(version="0.10.0", reason="Use build_circuit or build_processor instead")
     def build(self):
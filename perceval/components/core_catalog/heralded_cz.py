@@ -52,7 +52,6 @@ data (dual rail) ─────┤     ├───── data (dual rail)
 
     def __init__(self):
         super().__init__("heralded cz")
-        self._default_opts['type'] = AsType.PROCESSOR
 
     @deprecated(version="0.10.0", reason="Use build_circuit or build_processor instead")
     def build(self):
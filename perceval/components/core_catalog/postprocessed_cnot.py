@@ -47,7 +47,7 @@ data (dual rail) ─────┤     ├───── data (dual rail)
 
     def __init__(self):
         super().__init__("postprocessed cnot")
-        self._default_opts['type'] = AsType.PROCESSOR
+        self._circuit = None
 
     @deprecated(version="0.10.0", reason="Use build_circuit or build_processor instead")
     def build(self):
@@ -57,6 +57,13 @@ data (dual rail) ─────┤     ├───── data (dual rail)
             return self.build_processor(backend=self._opt('backend'))
 
     def build_circuit(self, **kwargs):
+        # The gate has no free parameter: build it once, then return copies of the cached circuit
+        if self._circuit is None:
+            self._circuit = self._build_circuit()
+        return self._circuit.copy()
+
+    @staticmethod
+    def _build_circuit():
         theta_13 = BS.r_to_theta(1 / 3)
         return (Circuit(6, name="PostProcessed CNOT")
                 .add(0, PERM([0, 2, 3, 4, 1]))  # So that both heralded modes are on the bottom of the gate
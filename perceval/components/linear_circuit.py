@@ -532,8 +532,18 @@ class Circuit(ACircuit):
                                  use_symbolic: bool,
                                  use_polarization: bool) -> Matrix:
         """compute the unitary matrix corresponding to the current circuit"""
-        u = None
         multiplier = 2 if use_polarization else 1
+        if not use_symbolic and self._components:
+            # Apply each component to the rows it acts on, rather than embedding it in a full size identity matrix and
+            # multiplying full size matrices: O(k².m) instead of O(m³) for a k-mode component
+            u = Matrix.eye(multiplier*self._m)
+            for r, c in self._components:
+                cU = c.compute_unitary(use_symbolic=False, use_polarization=use_polarization)
+                start, end = multiplier*r[0], multiplier*(r[-1]+1)
+                u[start:end, :] = cU @ u[start:end, :]
+            return u
+
+        u = None
         for r, c in self._components:
             cU = c.compute_unitary(use_symbolic=use_symbolic, use_polarization=use_polarization)
             if len(r) != multiplier*self._m:
@@ -608,6 +618,7 @@ class Circuit(ACircuit):
         nc._components = []
         for r, c in self._components:
             nc.add(r, c.copy(subs=subs))
+            nc._components[-1][1]._x_grid = c._x_grid  # Keep the display alignment, which add resets
         return nc
 
     @staticmethod
@@ -35,16 +35,16 @@ from perceval.utils import BasicState, Encoding, LogicalState
 from .abstract_component import AComponent
 
 
+_PORT_SIZE = {
+    Encoding.DUAL_RAIL: 2,
+    Encoding.POLARIZATION: 1,
+    Encoding.TIME: 1,
+    Encoding.RAW: 1
+}
+
+
 def _port_size(encoding: Encoding):
-    if encoding == Encoding.DUAL_RAIL:
-        return 2
-    elif encoding == Encoding.POLARIZATION:
-        return 1
-    elif encoding == Encoding.TIME:
-        return 1
-    elif encoding == Encoding.RAW:
-        return 1
-    return None  # Port size cannot be deduced only with encoding in case of Qudit-encoding
+    return _PORT_SIZE.get(encoding)  # Port size cannot be deduced only with encoding in case of Qudit-encoding
 
 
 class PortLocation(Enum):
@@ -204,17 +204,25 @@ class CounterDetector(ADetector):
 class DigitalConverterDetector(ADetector):
     def __init__(self, name=''):
         super().__init__(name)
-        self._connections = {}
+        # Connected components and their actions are stored in parallel lists, so that trigger iterates them directly
+        self._components = []
+        self._actions = []
+        self._component_index = {}
 
     def trigger(self, value):
-        for component, action in self._connections.items():
+        for component, action in zip(self._components, self._actions):
             action(value, component)
 
     def connect_to(self, obj, action_func):
-        self._connections[obj] = action_func
+        if obj in self._component_index:
+            self._actions[self._component_index[obj]] = action_func
+        else:
+            self._component_index[obj] = len(self._components)
+            self._components.append(obj)
+            self._actions.append(action_func)
 
     def is_connected_to(self, component) -> bool:
-        return component in self._connections
+        return component in self._component_index
 
 
 def get_basic_state_from_ports(ports: List[APort], state: LogicalState, add_herald_and_ancillary: bool = False) -> BasicState:
@@ -29,6 +29,7 @@
 
 import sys
 
+from collections import defaultdict
 from multipledispatch import dispatch
 from numpy import inf
 from typing import Dict, Callable, Union, List
@@ -64,6 +65,7 @@ class Processor(AProcessor):
     def __init__(self, backend: Union[ABackend, str], m_circuit: Union[int, ACircuit] = None, source: Source = None,
                  noise: NoiseModel = None, name: str = "Local processor"):
         super().__init__()
+        self._linear_circuit_cache: Dict[bool, Circuit] = {}  # Assembled linear circuits, keyed by `flatten`
         self._init_backend(backend)
         self._init_circuit(m_circuit)
         self._init_noise(noise, source)
@@ -211,6 +213,7 @@ class Processor(AProcessor):
     def _circuit_changed(self):
         # Override parent's method to reset the internal simulator as soon as the component list changes
         self._simulator = None
+        self._linear_circuit_cache = {}
 
     def with_polarized_input(self, bs: BasicState):
         assert bs.has_polarization, "BasicState is not polarized, please use with_input instead"
@@ -234,7 +237,8 @@ class Processor(AProcessor):
 
     def _state_selected_physical(self, output_state: BasicState) -> bool:
         if self.is_threshold:
-            modes_with_photons = len([n for n in output_state if n > 0])
+            # The photon count of the thresholded state is the number of modes with photons, computed natively
+            modes_with_photons = output_state.threshold_detection().n
             return modes_with_photons >= self._min_detected_photons_filter
         return output_state.n >= self._min_detected_photons_filter
 
@@ -247,7 +251,15 @@ class Processor(AProcessor):
         :raises RuntimeError: If any component is non-unitary
         :return: The resulting Circuit object
         """
-        circuit = super().linear_circuit(flatten)
+        circuit = self._get_linear_circuit(flatten)
+        # Never hand out the cached circuit itself: modifying the result must not change what the processor simulates
+        return circuit.copy() if circuit is self._linear_circuit_cache[flatten] else circuit
+
+    def _get_linear_circuit(self, flatten: bool = False) -> Circuit:
+        # Same as linear_circuit, but may return the circuit cached in the processor, which must not be modified
+        if flatten not in self._linear_circuit_cache:
+            self._linear_circuit_cache[flatten] = super().linear_circuit(flatten)
+        circuit = self._linear_circuit_cache[flatten]
         if not self._phase_quantization:
             return circuit
         # Apply phase quantization noise on all phase parameters in the circuit
@@ -264,7 +276,7 @@ class Processor(AProcessor):
         from perceval.simulators import NoisySamplingSimulator
         assert isinstance(self.backend, ASamplingBackend), "A sampling backend is required to call samples method"
         sampling_simulator = NoisySamplingSimulator(self.backend)
-        sampling_simulator.set_circuit(self.linear_circuit())
+        sampling_simulator.set_circuit(self._get_linear_circuit())
         sampling_simulator.set_selection(
             min_detected_photons_filter=self._min_detected_photons_filter, postselect=self.post_select_fn, heralds=self.heralds)
         sampling_simulator.set_threshold_detector(self.is_threshold)
@@ -282,7 +294,7 @@ class Processor(AProcessor):
             from perceval.simulators import SimulatorFactory  # Avoids a circular import
             self._simulator = SimulatorFactory.build(self)
         else:
-            self._simulator.set_circuit(self.linear_circuit() if self._is_unitary else self.components)
+            self._simulator.set_circuit(self._get_linear_circuit() if self._is_unitary else self.components)
 
         if precision is not None:
             self._simulator.set_precision(precision)
@@ -291,13 +303,20 @@ class Processor(AProcessor):
         res = self._simulator.probs_svd(self._inputs_map, progress_callback=progress_callback)
         get_logger().info("Local strong simulation complete!", channel.general)
         pperf = 1
-        postprocessed_res = BSDistribution()
+        # Accumulate in a plain dict: BSDistribution item access type-checks every key, which is only required once
+        # per distinct post-processed state
+        accumulated = defaultdict(float)
+        state_selected_physical = self._state_selected_physical
+        postprocess_output = self.postprocess_output
         for state, prob in res['results'].items():
-            if self._state_selected_physical(state):
-                postprocessed_res[self.postprocess_output(state)] += prob
+            if state_selected_physical(state):
+                accumulated[postprocess_output(state)] += prob
             else:
                 pperf -= prob
 
+        postprocessed_res = BSDistribution()
+        for state, prob in accumulated.items():
+            postprocessed_res[state] = prob
         postprocessed_res.normalize()
         res['physical_perf'] = res['physical_perf']*pperf if 'physical_perf' in res else pperf
         res['results'] = postprocessed_res
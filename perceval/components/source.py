@@ -190,6 +190,10 @@ class Source:
                 svd.add(StateVector(BasicState([len(photons)], {0: photons})), prob)
         return svd
 
+    @staticmethod
+    def _vacuum_distribution(m: int) -> SVDistribution:
+        return SVDistribution(StateVector([0] * m))
+
     def generate_distribution(self, expected_input: BasicState, prob_threshold: float = 0):
         """
         Simulates plugging the photonic source on certain modes and turning it on.
@@ -204,8 +208,18 @@ class Source:
         dist = SVDistribution()
         prob_threshold = max(prob_threshold, global_params['min_p'])
         get_logger().info(f"Apply 'Source' noise model to {expected_input}", channel.general)
+        # Consecutive empty modes are merged in a single vacuum factor, sparing a full pass on the distribution per mode
+        vacuum_modes = 0
         for photon_count in expected_input:
+            if photon_count == 0:
+                vacuum_modes += 1
+                continue
+            if vacuum_modes:
+                dist = SVDistribution.tensor_product(dist, self._vacuum_distribution(vacuum_modes), prob_threshold)
+                vacuum_modes = 0
             dist = SVDistribution.tensor_product(dist, self.probability_distribution(photon_count), prob_threshold)
+        if vacuum_modes:
+            dist = SVDistribution.tensor_product(dist, self._vacuum_distribution(vacuum_modes), prob_threshold)
         dist.normalize()
         if self.simplify_distribution and self.partially_distinguishable:
             dist = anonymize_annotations(dist, annot_tag='_')
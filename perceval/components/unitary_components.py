@@ -391,9 +391,17 @@ class PERM(Unitary):
 
     @property
     def perm_vector(self):
-        nz = np.nonzero(self._u)
-        m_list = nz[1].tolist()
-        return [m_list.index(i) for i in nz[0]]
+        rows, cols = np.nonzero(self._u)
+        perm = [0] * len(cols)
+        for r, c in zip(rows.tolist(), cols.tolist()):
+            perm[c] = r
+        return perm
+
+    @property
+    def inverse_perm_vector(self):
+        """Permutation vector of the inverse permutation, i.e. the input mode of each output mode"""
+        _, cols = np.nonzero(self._u)  # Exactly one non-zero value per row, returned in row order
+        return cols.tolist()
 
     def apply(self, r, sv):
         if isinstance(sv, BasicState):
@@ -402,10 +410,7 @@ class PERM(Unitary):
         min_r = r[0]
         max_r = r[-1] + 1
 
-        permutation = self.perm_vector
-        inv = np.empty_like(permutation)
-        inv[permutation] = np.arange(len(inv), dtype=inv.dtype)
-        inv = [inv[i].item() for i in range(len(inv))]
+        inv = self.inverse_perm_vector
 
         nsv = copy(sv)
         nsv.clear()
@@ -422,21 +427,25 @@ class PERM(Unitary):
         :return: An equivalent Circuit with only 2 mode PERM components
         """
 
-        perm_vec_req = self.perm_vector
-        perm_len = len(perm_vec_req)
+        inv_perm_vec_req = self.inverse_perm_vector
+        perm_len = len(inv_perm_vec_req)
 
         if perm_len == 2:
             return self
 
         circ = Circuit(perm_len, name="Decomposed PERM")
         new_perm_vec = list(range(perm_len))
+        new_perm_pos = list(range(perm_len))  # Position of each value in new_perm_vec
 
         for in_m_pos in range(perm_len):
-            out_m_pos = perm_vec_req.index(in_m_pos)
-            while new_perm_vec[in_m_pos] != out_m_pos:
-                swap_idx = new_perm_vec.index(out_m_pos)
-                new_perm_vec[swap_idx], new_perm_vec[swap_idx - 1] = new_perm_vec[swap_idx - 1], new_perm_vec[swap_idx]
+            out_m_pos = inv_perm_vec_req[in_m_pos]
+            swap_idx = new_perm_pos[out_m_pos]
+            while swap_idx != in_m_pos:
+                other = new_perm_vec[swap_idx - 1]
+                new_perm_vec[swap_idx - 1], new_perm_vec[swap_idx] = out_m_pos, other
+                new_perm_pos[out_m_pos], new_perm_pos[other] = swap_idx - 1, swap_idx
                 circ.add(swap_idx - 1, PERM([1, 0]))
+                swap_idx -= 1
 
         return circ
 
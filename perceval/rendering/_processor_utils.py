@@ -81,7 +81,7 @@ def collect_herald_info(processor: AProcessor, recursive: bool):
                     if forward_pass:
                         mode = component.perm_vector[mode - m0] + m0
                     else:
-                        mode = component.perm_vector.index(mode - m0) + m0
+                        mode = component.inverse_perm_vector[mode - m0] + m0
                 else:
                     h_info = herald_info.setdefault(
                         component, ComponentHeraldInfo())
@@ -255,6 +255,17 @@ class Canvas(ABC):
             self.position = (points[0]+size*len(text)/2, points[1]+size)
         return (f_points[0], self._inverse_Y * f_points[1])
 
+    def add_texts(self, texts: List[Tuple[Tuple[float, float], str]],
+                  size: float,
+                  ta: str = "left",  # Literal["left", "middle", "right"]
+                  fontstyle: str = "normal"  # Literal["normal", "bold", "italic"]
+                  ):
+        """
+        Adds several texts sharing the same style, given as (points, text) pairs
+        """
+        for points, text in texts:
+            self.add_text(points, text, size, ta, fontstyle)
+
     def add_shape(self, shape_fn, circuit, content, mode_style, **opt):
         shape_fn(circuit, self, content, mode_style, **opt)
 
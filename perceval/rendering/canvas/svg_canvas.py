@@ -41,6 +41,8 @@ class SvgCanvas(Canvas):
     This class relies on drawsvg 3rd party library.
     With it, it is possible to create dynamic svg graphics.
     """
+    _PATH_DECIMALS = 2  # Hundredths of a unit, where modes are 50 units apart
+
     def __init__(self, **opts):
         super().__init__(**opts)
         self._draws = []
@@ -69,6 +71,8 @@ class SvgCanvas(Canvas):
     def add_mpath(self, points, stroke="black", stroke_width=1, fill=None, stroke_linejoin="miter",
                   stroke_dasharray=None):
         points = super().add_mpath(points, stroke, stroke_width, fill)
+        # Drop floating point noise from path coordinates, which otherwise get written with up to 17 digits
+        points = [x if isinstance(x, str) else round(x, self._PATH_DECIMALS) for x in points]
         if fill is None:
             fill = "none"
         p = draw.Path(stroke_width=stroke_width, stroke=stroke, stroke_linejoin=stroke_linejoin,
@@ -98,19 +102,36 @@ class SvgCanvas(Canvas):
         self._draws.append(draw.Circle(points[0], points[1], r,
                                        stroke_width=stroke_width, fill=fill, stroke=stroke))
 
-    def add_text(self, points, text, size, ta="start", fontstyle="normal"):
+    @staticmethod
+    def _text_style(ta, fontstyle):
+        """Maps text anchor and font style to their SVG equivalent attributes"""
         if ta == "right":
             ta = "end"
         elif ta == "left":
             ta = "start"
-        points = super().add_text(points, text, size, ta)
         opts = {'text_anchor': ta}
         if fontstyle == "italic":
             opts['font_style'] = "italic"
         elif fontstyle == "bold":
             opts['font_weight'] = "bold"
+        return opts
+
+    def add_text(self, points, text, size, ta="start", fontstyle="normal"):
+        opts = self._text_style(ta, fontstyle)
+        points = super().add_text(points, text, size, opts['text_anchor'])
         self._draws.append(draw.Text(text, size, *points, **opts))
 
+    def add_texts(self, texts, size, ta="left", fontstyle="normal"):
+        if not texts:
+            return
+        # Style attributes are set once on a group, rather than repeated on each text element
+        opts = self._text_style(ta, fontstyle)
+        group = draw.Group(font_size=size, **opts)
+        for points, text in texts:
+            points = super().add_text(points, text, size, opts['text_anchor'])
+            group.append(draw.Text(text, None, *points))
+        self._draws.append(group)
+
     def draw(self):
         super().draw()
         if hasattr(self, "_group"):
@@ -38,6 +38,7 @@ from .renderer import create_renderer
 
 class DisplayConfig:
     _selected_skin = PhysSkin  # Default skin is PhysSkin
+    _skin_instances = {}  # Skins are not modified by rendering, so pdisplay shares instances between displays
 
     @staticmethod
     def select_skin(skin: Type[ASkin]) -> None:
@@ -46,3 +47,11 @@ class DisplayConfig:
     @staticmethod
     def get_selected_skin(**kwargs) -> ASkin:
         return DisplayConfig._selected_skin(**kwargs)
+
+    @staticmethod
+    def _get_shared_skin(**kwargs) -> ASkin:
+        # Internal to pdisplay: the returned instance is shared between displays and must not be modified
+        key = (DisplayConfig._selected_skin, tuple(sorted(kwargs.items())))
+        if key not in DisplayConfig._skin_instances:
+            DisplayConfig._skin_instances[key] = DisplayConfig._selected_skin(**kwargs)
+        return DisplayConfig._skin_instances[key]
@@ -128,8 +128,7 @@ class PhysSkin(ASkin):
             m_index = opts['starting_mode']
         canvas.add_rect((-2, 15), 12, 50*port.m - 30, fill="lightgray")
         if m_index is not None:
-            for i in range(port.m):
-                canvas.add_text((4, 50 * i + 27), text=str(m_index+i), size=7, ta="middle")
+            canvas.add_texts([((4, 50 * i + 27), str(m_index+i)) for i in range(port.m)], size=7, ta="middle")
         if port.name:
             canvas.add_text((-2, 50*port.m - 9), text='[' + port.name + ']', size=6, ta="left", fontstyle="italic")
 
@@ -139,8 +138,7 @@ class PhysSkin(ASkin):
             m_index = opts['starting_mode']
         canvas.add_rect((15, 15), 12, 50*port.m - 30, fill="lightgray")
         if m_index is not None:
-            for i in range(port.m):
-                canvas.add_text((21, 50 * i + 27), text=str(m_index+i), size=7, ta="middle")
+            canvas.add_texts([((21, 50 * i + 27), str(m_index+i)) for i in range(port.m)], size=7, ta="middle")
         if port.name:
             canvas.add_text((27, 50*port.m - 9), text='[' + port.name + ']', size=6, ta="right", fontstyle="italic")
 
@@ -276,8 +274,7 @@ class PhysSkin(ASkin):
         canvas.add_rect((13, 7), width=14, height=36, fill="gray",
                         stroke_width=1, stroke="black", stroke_linejoin="miter")
         canvas.add_mline([20, 7, 20, 43], stroke="black", stroke_width=1)
-        canvas.add_text((28.5, 36), text=params[0], size=7, ta="left")
-        canvas.add_text((28.5, 45), text=params[1], size=7, ta="left")
+        canvas.add_texts([((28.5, 36), params[0]), ((28.5, 45), params[1])], size=7, ta="left")
 
     def pr_shape(self, circuit, canvas, content, mode_style, **opts):
         canvas.add_mline([0, 25, 15, 25], **self.style[ModeStyle.PHOTONIC])
@@ -442,29 +442,21 @@ class CanvasRenderer(ICircuitRenderer):
         return self._skin.get_size(circuit, recursive)
 
     def add_mode_index(self):
-        for k in range(self._nsize):
-            if self._mode_style[k] != ModeStyle.HERALD:
-                self._canvas.add_text(
-                    (CanvasRenderer.AFFIX_ALL_SIZE,
-                     CanvasRenderer.SCALE / 2 + 3 + CanvasRenderer.SCALE * k),
-                    str(k),
-                    self._n_font_size,
-                    ta="right")
+        displayed_modes = [k for k in range(self._nsize) if self._mode_style[k] != ModeStyle.HERALD]
+        self._canvas.add_texts(
+            [((CanvasRenderer.AFFIX_ALL_SIZE, CanvasRenderer.SCALE / 2 + 3 + CanvasRenderer.SCALE * k), str(k))
+             for k in displayed_modes],
+            self._n_font_size,
+            ta="right")
 
         self._canvas.set_offset(
             (0, 0),
             CanvasRenderer.AFFIX_ALL_SIZE,
             CanvasRenderer.SCALE * (self._nsize + 1))
-        for k in range(self._nsize):
-            if self._mode_style[k] != ModeStyle.HERALD:
-                self._canvas.add_text(
-                    (
-                        0,
-                        CanvasRenderer.SCALE / 2 + 3 + CanvasRenderer.SCALE * k
-                    ),
-                    str(k),
-                    self._n_font_size,
-                    ta="left")
+        self._canvas.add_texts(
+            [((0, CanvasRenderer.SCALE / 2 + 3 + CanvasRenderer.SCALE * k), str(k)) for k in displayed_modes],
+            self._n_font_size,
+            ta="left")
 
     def add_out_port(self, n_mode, port, **opts):
         max_pos = max(self._chart[0:self._nsize])
@@ -27,7 +27,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from multipledispatch import dispatch
+from functools import lru_cache
 
 from perceval.components import AComponent, Circuit, Port, PortLocation, Herald,\
     unitary_components as cp,\
@@ -36,127 +36,121 @@ from .abstract_skin import ASkin, ModeStyle
 from .skin_common import bs_convention_color
 
 
+# Static SVG path data of the beam splitter shapes, shared between all drawn components
+_BS_PATH_COMPACT = ("M", 6.4721, 25.0002, "c", 6.8548, 0, 6.8241, 24.9998, 13.6789, 24.9998, "m", 0.0009, 0, "c",
+                    -6.8558, 0, -6.825, 24.9998, -13.6799, 24.9998, "m", 13.6799, -24.9998, "h", 10.9423, "m", 0, 0,
+                    "c", 6.8558, 0, 6.825, -24.9998, 13.6799, -24.9998, "m", -13.6799, 24.9998, "c", 6.8558, 0, 6.825,
+                    24.9998, 13.6799, 24.9998, "m", -44.7741, -49.9998, "h", 6.5, "m", 0.0009, 49.9998, "h", -6.5009,
+                    "m", 43.8227, 0, "h", 6.1773, "m", -6.4028, -50, "h", 6.4028)
+_BS_PATH_FULL = ("M", 12.9442, 25.0002, "c", 13.7096, 0, 13.6481, 24.9998, 27.3577, 24.9998, "m", 0.0019, 0, "c",
+                 -13.7116, 0, -13.65, 24.9998, -27.3597, 24.9998, "m", 27.3597, -24.9998, "h", 21.8846, "m", 0, 0, "c",
+                 13.7116, 0, 13.65, -24.9998, 27.3597, -24.9998, "m", -27.3597, 24.9998, "c", 13.7116, 0, 13.65,
+                 24.9998, 27.3597, 24.9998, "m", -89.5481, -49.9998, "h", 13, "m", 0.0019, 49.9998, "h", -13.0019, "m",
+                 87.6453, 0, "h", 12.3547, "m", -12.8056, -50, "h", 12.8056)
+_PBS_PATH1_COMPACT = ("M", 0, 25.1, "h", 11.049, "m", -11.049, 50, "h", 10.9375, "m", 27.9029, -50, "h", 11.1596, "m",
+                      -11.3283, 50, "h", 11.3283, "m", -11.3283, 0, "c", -10.0446, 0, -17.5781, -50, -27.7341, -50,
+                      "m", 27.9029, 0, "c", -10.7156, 0, -17.7467, 50, -27.7914, 50)
+_PBS_PATH1_FULL = ("M", 0, 25.1, "h", 22.0981, "m", -22.0981, 50, "h", 21.8751, "m", 55.8057, -50, "h", 22.3192, "m",
+                   -22.6566, 50, "h", 22.6566, "m", -22.6566, 0, "c", -20.0892, 0, -35.1561, -50, -55.4683, -50, "m",
+                   55.8057, 0, "c", -21.4311, 0, -35.4935, 50, -55.5827, 50)
+_PBS_PATH2_COMPACT = ("M", 30, 50, "l", -4.7404, -5.2543, "l", -4.7404, 5.2543, "l", 4.7404, 5.2543, "l", 4.7404,
+                      -5.2543, "z", "m", 0.175, 0, "h", -9.6, "z")
+_PBS_PATH2_FULL = ("M", 59, 50, "l", -9.4807, -10.5087, "l", -9.4807, 10.5087, "l", 9.4807, 10.5087, "l", 9.4807,
+                   -10.5087, "z", "m", 0.35, 0, "h", -19.2, "z")
+
+
+@lru_cache(maxsize=32)
+def _unitary_box_path(w: int) -> tuple:
+    # Rounded box of a w-mode Unitary, only depending on its width
+    radius = 6.25 * w  # Radius of the rounded corners
+    return ("M", 0, radius, "c", 0, 0, 0, -radius, radius, -radius, "l", 6 * radius, 0, "c", radius, 0, radius, radius,
+            radius, radius, "l", 0, 6 * radius, "c", 0, 0, 0, radius, -radius, radius, "l", -6 * radius, 0, "c",
+            -radius, 0, -radius, -radius, -radius, -radius, "l", 0, -6 * radius)
+
+
 class SymbSkin(ASkin):
+    # Dispatch tables, resolved on the component type MRO (the most derived registered type wins) and memoized per type
+    _WIDTH_TABLE = {
+        AComponent: lambda self, c: 1,  # Absolute fallback
+        cp.Unitary: lambda self, c: c.m,
+        Circuit: lambda self, c: 2,
+        cp.Barrier: lambda self, c: 1,
+        cp.BS: lambda self, c: 1 if self._compact else 2,
+        cp.PBS: lambda self, c: 1 if self._compact else 2,
+        cp.PS: lambda self, c: 1,
+        nu.TD: lambda self, c: 1,
+        cp.PERM: lambda self, c: 1,
+        cp.WP: lambda self, c: 1,
+        cp.PR: lambda self, c: 1,
+        nu.LC: lambda self, c: 1,
+    }
+
+    _SHAPE_TABLE = {
+        AComponent: "default_shape",
+        cp.BS: "bs_shape",
+        cp.PS: "ps_shape",
+        cp.PBS: "pbs_shape",
+        nu.TD: "td_shape",
+        cp.Unitary: "unitary_shape",
+        cp.PERM: "perm_shape",
+        cp.WP: "wp_shape",
+        cp.HWP: "hwp_shape",
+        cp.QWP: "qwp_shape",
+        cp.PR: "pr_shape",
+        cp.Barrier: "barrier_shape",
+        nu.LC: "lc_shape",
+    }
+
+    _PORT_SHAPE_TABLE = {
+        Port: ("port_shape_in", "port_shape_out"),
+        Herald: ("herald_shape_in", "herald_shape_out"),
+    }
+
     def __init__(self, compact_display: bool = False):
         super().__init__({"stroke": "black", "stroke_width": 1},
                          {"width": 1,
                           "fill": "white",
                           "stroke_style": {"stroke": "black", "stroke_width": 1}},
                          compact_display)
+        self._resolved = {}
 
-    @dispatch(AComponent)
-    def get_width(self, c) -> int:
-        """Absolute fallback"""
-        return 1
-
-    @dispatch(cp.Unitary)
-    def get_width(self, c) -> int:
-        return c.m
-
-    @dispatch(Circuit)
-    def get_width(self, c) -> int:
-        return 2
-
-    @dispatch((cp.Barrier))
-    def get_width(self, c) -> int:
-        return 1
+    def _lookup(self, table: dict, c):
+        key = (id(table), type(c))
+        if key not in self._resolved:
+            self._resolved[key] = next((table[t] for t in type(c).__mro__ if t in table), None)
+        entry = self._resolved[key]
+        if entry is None:
+            raise NotImplementedError(f"No rendering defined for {type(c).__name__}")
+        return entry
 
-    @dispatch((cp.BS, cp.PBS))
     def get_width(self, c) -> int:
-        w = 1 if self._compact else 2
-        return w
-
-    @dispatch((cp.PS, nu.TD, cp.PERM, cp.WP, cp.PR, nu.LC))
-    def get_width(self, c) -> int:
-        return 1
-
-    @dispatch(AComponent)
-    def get_shape(self, c):
-        return self.default_shape
-
-    @dispatch(cp.BS)
-    def get_shape(self, c):
-        return self.bs_shape
-
-    @dispatch(cp.PS)
-    def get_shape(self, c):
-        return self.ps_shape
-
-    @dispatch(cp.PBS)
-    def get_shape(self, c):
-        return self.pbs_shape
-
-    @dispatch(nu.TD)
-    def get_shape(self, c):
-        return self.td_shape
-
-    @dispatch(cp.Unitary)
-    def get_shape(self, c):
-        return self.unitary_shape
-
-    @dispatch(cp.PERM)
-    def get_shape(self, c):
-        return self.perm_shape
-
-    @dispatch(cp.WP)
-    def get_shape(self, c):
-        return self.wp_shape
-
-    @dispatch(cp.HWP)
-    def get_shape(self, c):
-        return self.hwp_shape
-
-    @dispatch(cp.QWP)
-    def get_shape(self, c):
-        return self.qwp_shape
-
-    @dispatch(cp.PR)
-    def get_shape(self, c):
-        return self.pr_shape
-
-    @dispatch(cp.Barrier)
-    def get_shape(self, c):
-        return self.barrier_shape
-
-    @dispatch(nu.LC)
-    def get_shape(self, c):
-        return self.lc_shape
-
-    @dispatch(Port, PortLocation)
-    def get_shape(self, port, location):
-        if location == PortLocation.INPUT:
-            return self.port_shape_in
-        return self.port_shape_out
-
-    @dispatch(Herald, PortLocation)
-    def get_shape(self, herald, location):
-        if location == PortLocation.INPUT:
-            return self.herald_shape_in
-        return self.herald_shape_out
+        return self._lookup(self._WIDTH_TABLE, c)(self, c)
+
+    def get_shape(self, c, location: PortLocation = None):
+        if location is None:
+            return getattr(self, self._lookup(self._SHAPE_TABLE, c))
+        shape_in, shape_out = self._lookup(self._PORT_SHAPE_TABLE, c)
+        return getattr(self, shape_in if location == PortLocation.INPUT else shape_out)
+
+    @staticmethod
+    def _mode_wires(m: int, w: int) -> list:
+        # Horizontal wires of all modes crossing a block, drawn as a single multi-segment path
+        path = []
+        for i in range(m):
+            path += ["M", 0, 25 + i*50, "l", 50*w, 0]
+        return path
 
     def default_shape(self, circuit, canvas, content, mode_style, **opts):
         """
         Default shape is a gray box
         """
         w = self.get_width(circuit)
-        for i in range(circuit.m):
-            canvas.add_mpath(["M", 0, 25 + i*50, "l", 50*w, 0], **self.style[ModeStyle.PHOTONIC])
+        canvas.add_mpath(self._mode_wires(circuit.m, w), **self.style[ModeStyle.PHOTONIC])
         canvas.add_rect((5, 5), 50*w - 10, 50*circuit.m - 10, fill="lightgray")
         canvas.add_text((25*w, 25*circuit.m), size=7, ta="middle", text=content)
 
     def bs_shape(self, bs, canvas, content, mode_style, **opts):
-        if self._compact:
-            path_data = ["M", 6.4721, 25.0002, "c", 6.8548, 0, 6.8241, 24.9998, 13.6789, 24.9998, "m", 0.0009, 0, "c",
-                         -6.8558, 0, -6.825, 24.9998, -13.6799, 24.9998, "m", 13.6799, -24.9998, "h", 10.9423, "m", 0,
-                         0, "c", 6.8558, 0, 6.825, -24.9998, 13.6799, -24.9998, "m", -13.6799, 24.9998, "c", 6.8558, 0,
-                         6.825, 24.9998, 13.6799, 24.9998, "m", -44.7741, -49.9998, "h", 6.5, "m", 0.0009, 49.9998, "h",
-                         -6.5009, "m", 43.8227, 0, "h", 6.1773, "m", -6.4028, -50, "h", 6.4028]
-        else:
-            path_data = ["M", 12.9442, 25.0002, "c", 13.7096, 0, 13.6481, 24.9998, 27.3577, 24.9998, "m", 0.0019, 0,
-                         "c", -13.7116, 0, -13.65, 24.9998, -27.3597, 24.9998, "m", 27.3597, -24.9998, "h", 21.8846,
-                         "m", 0, 0, "c", 13.7116, 0, 13.65, -24.9998, 27.3597, -24.9998, "m", -27.3597, 24.9998, "c",
-                         13.7116, 0, 13.65, 24.9998, 27.3597, 24.9998, "m", -89.5481, -49.9998, "h", 13, "m", 0.0019,
-                         49.9998, "h", -13.0019, "m", 87.6453, 0, "h", 12.3547, "m", -12.8056, -50, "h", 12.8056]
+        path_data = _BS_PATH_COMPACT if self._compact else _BS_PATH_FULL
         canvas.add_mpath(path_data, **self.style[ModeStyle.PHOTONIC])
         canvas.add_text((25 if self._compact else 50, 38),
                         content.replace('phi', 'Φ').replace('theta=', 'Θ='),
@@ -183,23 +177,8 @@ class SymbSkin(ASkin):
         canvas.add_text((6, 20), text=content, size=7, ta="left")
 
     def pbs_shape(self, circuit, canvas, content, mode_style, **opts):
-        if self._compact:
-            path_data1 = ["M", 0, 25.1, "h", 11.049, "m", -11.049, 50, "h", 10.9375, "m", 27.9029, -50, "h",
-                          11.1596,
-                          "m", -11.3283, 50, "h", 11.3283, "m", -11.3283, 0, "c", -10.0446, 0, -17.5781, -50,
-                          -27.7341,
-                          -50, "m", 27.9029, 0, "c", -10.7156, 0, -17.7467, 50, -27.7914, 50]
-            path_data2 = ["M", 30, 50, "l", -4.7404, -5.2543, "l", -4.7404, 5.2543, "l", 4.7404, 5.2543, "l",
-                          4.7404, -5.2543, "z", "m", 0.175, 0, "h", -9.6, "z"]
-        else:
-            path_data1 = ["M", 0, 25.1, "h", 22.0981, "m", -22.0981, 50, "h", 21.8751, "m", 55.8057, -50, "h",
-                          22.3192,
-                          "m", -22.6566, 50, "h", 22.6566, "m", -22.6566, 0, "c", -20.0892, 0, -35.1561, -50,
-                          -55.4683,
-                          -50, "m", 55.8057, 0, "c", -21.4311, 0, -35.4935, 50, -55.5827, 50]
-            path_data2 = ["M", 59, 50, "l", -9.4807, -10.5087, "l", -9.4807, 10.5087, "l", 9.4807, 10.5087, "l",
-                          9.4807,
-                          -10.5087, "z", "m", 0.35, 0, "h", -19.2, "z"]
+        path_data1 = _PBS_PATH1_COMPACT if self._compact else _PBS_PATH1_FULL
+        path_data2 = _PBS_PATH2_COMPACT if self._compact else _PBS_PATH2_FULL
         canvas.add_mpath(path_data1, **self.style[ModeStyle.PHOTONIC])
         canvas.add_mpath(path_data2, stroke_width=1, fill="#fff")
         canvas.add_text((25 if self._compact else 50, 86), text=content, size=7, ta="middle")
@@ -220,14 +199,8 @@ class SymbSkin(ASkin):
 
     def unitary_shape(self, circuit, canvas, content, mode_style, **opts):
         w = circuit.m
-        for i in range(circuit.m):
-            canvas.add_mpath(["M", 0, 25 + i*50, "l", 50*w, 0], **self.style[ModeStyle.PHOTONIC])
-        radius = 6.25 * w  # Radius of the rounded corners
-        canvas.add_mpath(
-            ["M", 0, radius, "c", 0, 0, 0, -radius, radius, -radius, "l", 6 * radius, 0, "c", radius, 0, radius, radius,
-             radius, radius, "l", 0, 6 * radius, "c", 0, 0, 0, radius, -radius, radius, "l", -6 * radius, 0, "c",
-             -radius, 0, -radius, -radius, -radius, -radius, "l", 0, -6 * radius],
-            **self.style[ModeStyle.PHOTONIC], fill="lightyellow")
+        canvas.add_mpath(self._mode_wires(circuit.m, w), **self.style[ModeStyle.PHOTONIC])
+        canvas.add_mpath(_unitary_box_path(w), **self.style[ModeStyle.PHOTONIC], fill="lightyellow")
         canvas.add_text((25*w, 25*w), size=10, ta="middle", text=circuit.name)
 
     def barrier_shape(self, circuit, canvas, content, mode_style, **opts):
@@ -258,8 +231,7 @@ class SymbSkin(ASkin):
         style = self.style[ModeStyle.PHOTONIC]
         canvas.add_mpath(["M", 0, 25, "h", 15, "m", 21, 0, "h", 15], **style)
         canvas.add_mpath(["M", 15, 45, "h", 21, "v", -40, "h", -21, "z"], **style)
-        canvas.add_text((25, 55), text=params[0], size=7, ta="middle")
-        canvas.add_text((25, 65), text=params[1], size=7, ta="middle")
+        canvas.add_texts([((25, 55), params[0]), ((25, 65), params[1])], size=7, ta="middle")
 
     def hwp_shape(self, circuit, canvas, content, mode_style, **opts):
         params = content.replace("xsi=", "ξ=").replace("delta=", "δ=").split("\n")
@@ -31,6 +31,7 @@ import copy
 import math
 import numpy
 import os
+import sys
 
 import warnings
 with warnings.catch_warnings():
@@ -40,6 +41,7 @@ with warnings.catch_warnings():
     import drawsvg
 
 import matplotlib.pyplot as plt
+from functools import lru_cache
 from mpl_toolkits.mplot3d.axes3d import Axes3D
 from multipledispatch import dispatch
 from tabulate import tabulate
@@ -59,9 +61,6 @@ from .format import Format
 from ._processor_utils import collect_herald_info
 
 
-in_notebook = False
-
-
 def in_ide():
     ide_detected = False
     for key in os.environ:
@@ -71,13 +70,19 @@ def in_ide():
     return ide_detected
 
 
-try:
-    from IPython import get_ipython
-    if 'IPKernelApp' in get_ipython().config:
-        in_notebook = True
-        from IPython.display import display, Math, HTML
-except (ImportError, AttributeError):
-    pass
+@lru_cache(maxsize=1)
+def _in_notebook() -> bool:
+    # A notebook kernel always runs on an already imported IPython: never import it here, as it is slow
+    if 'IPython' not in sys.modules:
+        return False
+    try:
+        from IPython import get_ipython
+        return 'IPKernelApp' in get_ipython().config
+    except (ImportError, AttributeError):
+        return False
+
+
+in_notebook = _in_notebook()
 
 
 def pdisplay_circuit(
@@ -91,7 +96,7 @@ def pdisplay_circuit(
         skin=None,
         **opts):
     if skin is None:
-        skin = DisplayConfig.get_selected_skin(compact_display=compact)
+        skin = DisplayConfig._get_shared_skin(compact_display=compact)
     w, h = skin.get_size(circuit, recursive)
     renderer, _ = create_renderer(
         circuit.m,
@@ -120,7 +125,7 @@ def pdisplay_processor(processor: AProcessor,
                        **opts):
     n_modes = processor.circuit_size
     if skin is None:
-        skin = DisplayConfig.get_selected_skin(compact_display=compact)
+        skin = DisplayConfig._get_shared_skin(compact_display=compact)
     w, h = skin.get_size(processor, recursive)
     renderer, pre_renderer = create_renderer(
         n_modes,
@@ -132,20 +137,21 @@ def pdisplay_processor(processor: AProcessor,
         **opts)
 
     herald_info = {}
-    if len(processor.heralds):
-        for k in processor.heralds.keys():
+    heralds = processor.heralds
+    if heralds:
+        for k in heralds:
             renderer.set_mode_style(k, ModeStyle.HERALD)
         herald_info = collect_herald_info(processor, recursive)
 
+    # Wrap sub-circuits once for both rendering passes
+    components = [(r[0], Circuit(c.m).add(0, c) if isinstance(c, Circuit) else c) for r, c in processor.components]
+
     for rendering_pass in [pre_renderer, renderer]:
         if not rendering_pass:
             continue
         rendering_pass.set_herald_info(herald_info)
         rendering_pass.open()
-        for r, c in processor.components:
-            shift = r[0]
-            if isinstance(c, Circuit):
-                c = Circuit(c.m).add(0, c)
+        for shift, c in components:
             rendering_pass.render_circuit(
                 c,
                 recursive=recursive,
@@ -457,11 +463,21 @@ def _pdisplay(c, **kwargs):
     return simple_complex(c, **_get_simple_number_kwargs(**kwargs))[1]
 
 
+def _dispatch_pdisplay(o, **kwargs):
+    # Circuits and processors are the most displayed objects: route them directly, and leave the other types to the
+    # multiple dispatcher
+    if isinstance(o, ACircuit):
+        return pdisplay_circuit(o, **kwargs)
+    if isinstance(o, AProcessor):
+        return pdisplay_processor(o, **kwargs)
+    return _pdisplay(o, **kwargs)
+
+
 def _default_output_format(o):
     """
     Deduces the best output format given the nature of the data to be displayed and the execution context
     """
-    if in_notebook:
+    if _in_notebook():
         if isinstance(o, Matrix):
             return Format.LATEX
         return Format.HTML
@@ -500,17 +516,16 @@ def pdisplay(o, output_format: Format = None, **opts):
     if output_format is None:
         output_format = _default_output_format(o)
         get_logger().debug(f"Output format defaulted to {output_format.name}", channel.general)
-    res = _pdisplay(o, output_format=output_format, **opts)
+    res = _dispatch_pdisplay(o, output_format=output_format, **opts)
 
     if res is None:
         return
 
     if isinstance(res, drawsvg.Drawing):
         return res
-    elif in_notebook and output_format == Format.LATEX:
-        display(Math(res))
-    elif in_notebook and output_format == Format.HTML:
-        display(HTML(res))
+    elif output_format in (Format.LATEX, Format.HTML) and _in_notebook():
+        from IPython.display import display, Math, HTML
+        display(Math(res) if output_format == Format.LATEX else HTML(res))
     else:
         print(res)
 
@@ -521,7 +536,7 @@ def pdisplay_to_file(o, path: str, output_format: Format = None, **opts):
     if output_format == Format.MPLOT:
         opts['mplot_savefig'] = path
         opts['mplot_noshow'] = True
-    res = _pdisplay(o, output_format=output_format, **opts)
+    res = _dispatch_pdisplay(o, output_format=output_format, **opts)
     if res is None:
         raise RuntimeError(f"pdisplay_to_file not defined for type {type(o)}")
 
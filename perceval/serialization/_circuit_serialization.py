@@ -27,9 +27,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from multipledispatch import dispatch
-
 from perceval.serialization import _schema_circuit_pb2 as pb
+from perceval.utils import Parameter
 from perceval.components import ACircuit, Circuit
 import perceval.components.unitary_components as comp
 import perceval.components.non_unitary_components as nu
@@ -38,16 +37,39 @@ from perceval.serialization._parameter_serialization import serialize_parameter
 
 
 class ComponentSerializer:
+    __slots__ = ('_pb', '_param_cache')
+
     def __init__(self):
         self._pb = None
+        # Parameter objects shared by several components (e.g. tied phases) are serialized only once per pass.
+        # The cache is bound to this serializer's lifetime, as parameter values may change between passes.
+        self._param_cache = {}
 
-    def serialize(self, r: int, c: ACircuit):
-        self._pb = pb.Component()
+    def serialize(self, r: int, c: ACircuit, pb_component: pb.Component = None):
+        """Serializes c in pb_component if given (e.g. an element added to a repeated field), in a new one otherwise"""
+        self._pb = pb.Component() if pb_component is None else pb_component
         self._pb.starting_mode = r
         self._pb.n_mode = c.m
         self._serialize(c)
         return self._pb
 
+    def _serialize(self, c: ACircuit):
+        serializer = self._SERIALIZER_BY_TYPE.get(type(c))
+        if serializer is None:  # Subclass of a serializable type: use its closest serializable ancestor
+            serializer = next((self._SERIALIZERS[t] for t in type(c).__mro__ if t in self._SERIALIZERS), None)
+            if serializer is None:
+                raise NotImplementedError(f"Cannot serialize component of type {type(c).__name__}")
+            self._SERIALIZER_BY_TYPE[type(c)] = serializer
+        serializer(self, c)
+
+    def _serialize_parameter(self, param):
+        if not isinstance(param, Parameter):
+            return serialize_parameter(param)
+        pb_param = self._param_cache.get(param)
+        if pb_param is None:
+            pb_param = self._param_cache[param] = serialize_parameter(param)
+        return pb_param
+
     def _convert_bs_convention(self, convention):
         if convention == comp.BSConvention.H:
             return pb.BeamSplitter.H
@@ -55,90 +77,78 @@ class ComponentSerializer:
             return pb.BeamSplitter.Ry
         return pb.BeamSplitter.Rx
 
-    @dispatch(comp.BS)
-    def _serialize(self, bs: comp.BS):
-        pb_bs = pb.BeamSplitter()
+    def _serialize_bs(self, bs: comp.BS):
+        pb_bs = self._pb.beam_splitter
         pb_bs.convention = self._convert_bs_convention(bs.convention)
-        pb_bs.theta.CopyFrom(serialize_parameter(bs._theta))
-        pb_bs.phi_tl.CopyFrom(serialize_parameter(bs._phi_tl))
-        pb_bs.phi_bl.CopyFrom(serialize_parameter(bs._phi_bl))
-        pb_bs.phi_tr.CopyFrom(serialize_parameter(bs._phi_tr))
-        pb_bs.phi_br.CopyFrom(serialize_parameter(bs._phi_br))
-        self._pb.beam_splitter.CopyFrom(pb_bs)
-
-    @dispatch(comp.PS)
-    def _serialize(self, ps: comp.PS):
-        pb_ps = pb.PhaseShifter()
-        pb_ps.phi.CopyFrom(serialize_parameter(ps._phi))
-        self._pb.phase_shifter.CopyFrom(pb_ps)
-
-    @dispatch(comp.PERM)
-    def _serialize(self, p: comp.PERM):
-        pb_perm = pb.Permutation()
-        pb_perm.permutations.extend(p.perm_vector)
-        self._pb.permutation.CopyFrom(pb_perm)
-
-    @dispatch(comp.Unitary)
-    def _serialize(self, unitary: comp.Unitary):
-        pb_umat = serialize_matrix(unitary.U)
-        pb_unitary = pb.Unitary()
-        pb_unitary.mat.CopyFrom(pb_umat)
+        pb_bs.theta.CopyFrom(self._serialize_parameter(bs._theta))
+        pb_bs.phi_tl.CopyFrom(self._serialize_parameter(bs._phi_tl))
+        pb_bs.phi_bl.CopyFrom(self._serialize_parameter(bs._phi_bl))
+        pb_bs.phi_tr.CopyFrom(self._serialize_parameter(bs._phi_tr))
+        pb_bs.phi_br.CopyFrom(self._serialize_parameter(bs._phi_br))
+
+    def _serialize_ps(self, ps: comp.PS):
+        self._pb.phase_shifter.phi.CopyFrom(self._serialize_parameter(ps._phi))
+
+    def _serialize_perm(self, p: comp.PERM):
+        self._pb.permutation.permutations.extend(p.perm_vector)
+
+    def _serialize_unitary(self, unitary: comp.Unitary):
+        pb_unitary = self._pb.unitary
+        pb_unitary.mat.CopyFrom(serialize_matrix(unitary.U))
         if unitary.name != comp.Unitary.DEFAULT_NAME:
             pb_unitary.name = unitary.name
         pb_unitary.use_polarization = unitary.requires_polarization
-        self._pb.unitary.CopyFrom(pb_unitary)
-
-    @dispatch(comp.PBS)
-    def _serialize(self, _):
-        pb_pbs = pb.PolarizedBeamSplitter()
-        self._pb.polarized_beam_splitter.CopyFrom(pb_pbs)
-
-    @dispatch(comp.QWP)
-    def _serialize(self, wp: comp.QWP):
-        pb_wp = pb.WavePlate()
-        pb_wp.xsi.CopyFrom(serialize_parameter(wp._xsi))
-        self._pb.quarter_wave_plate.CopyFrom(pb_wp)
-
-    @dispatch(comp.HWP)
-    def _serialize(self, wp: comp.HWP):
-        pb_wp = pb.WavePlate()
-        pb_wp.xsi.CopyFrom(serialize_parameter(wp._xsi))
-        self._pb.half_wave_plate.CopyFrom(pb_wp)
-
-    @dispatch(comp.WP)
-    def _serialize(self, wp: comp.WP):
-        pb_wp = pb.WavePlate()
-        pb_wp.delta.CopyFrom(serialize_parameter(wp._delta))
-        pb_wp.xsi.CopyFrom(serialize_parameter(wp._xsi))
-        self._pb.wave_plate.CopyFrom(pb_wp)
-
-    @dispatch(nu.TD)
-    def _serialize(self, td: nu.TD):
-        pb_td = pb.TimeDelay()
-        pb_td.dt.CopyFrom(serialize_parameter(td._dt))
-        self._pb.time_delay.CopyFrom(pb_td)
-
-    @dispatch(comp.PR)
-    def _serialize(self, pr: comp.PR):
-        pb_pr = pb.PolarizationRotator()
-        pb_pr.delta.CopyFrom(serialize_parameter(pr._delta))
-        self._pb.polarization_rotator.CopyFrom(pb_pr)
-
-    @dispatch(Circuit)
-    def _serialize(self, circuit: Circuit):
-        pb_circ = serialize_circuit(circuit)
-        self._pb.circuit.CopyFrom(pb_circ)
-
-
-def serialize_circuit(circuit: ACircuit) -> pb.Circuit:
+
+    def _serialize_pbs(self, _):
+        self._pb.polarized_beam_splitter.SetInParent()  # Empty message: only select it in the oneof
+
+    def _serialize_qwp(self, wp: comp.QWP):
+        self._pb.quarter_wave_plate.xsi.CopyFrom(self._serialize_parameter(wp._xsi))
+
+    def _serialize_hwp(self, wp: comp.HWP):
+        self._pb.half_wave_plate.xsi.CopyFrom(self._serialize_parameter(wp._xsi))
+
+    def _serialize_wp(self, wp: comp.WP):
+        pb_wp = self._pb.wave_plate
+        pb_wp.delta.CopyFrom(self._serialize_parameter(wp._delta))
+        pb_wp.xsi.CopyFrom(self._serialize_parameter(wp._xsi))
+
+    def _serialize_td(self, td: nu.TD):
+        self._pb.time_delay.dt.CopyFrom(self._serialize_parameter(td._dt))
+
+    def _serialize_pr(self, pr: comp.PR):
+        self._pb.polarization_rotator.delta.CopyFrom(self._serialize_parameter(pr._delta))
+
+    def _serialize_circuit(self, circuit: Circuit):
+        serialize_circuit(circuit, self._pb.circuit)
+
+    _SERIALIZERS = {
+        comp.BS: _serialize_bs,
+        comp.PS: _serialize_ps,
+        comp.PERM: _serialize_perm,
+        comp.Unitary: _serialize_unitary,
+        comp.PBS: _serialize_pbs,
+        comp.QWP: _serialize_qwp,
+        comp.HWP: _serialize_hwp,
+        comp.WP: _serialize_wp,
+        nu.TD: _serialize_td,
+        comp.PR: _serialize_pr,
+        Circuit: _serialize_circuit,
+    }
+    _SERIALIZER_BY_TYPE = dict(_SERIALIZERS)  # Also caches the resolution of subclasses
+
+
+def serialize_circuit(circuit: ACircuit, pb_circuit: pb.Circuit = None) -> pb.Circuit:
     if not isinstance(circuit, Circuit):
         circuit = Circuit(circuit.m).add(0, circuit)
 
-    pb_circuit = pb.Circuit()
+    if pb_circuit is None:
+        pb_circuit = pb.Circuit()
     if circuit.name != Circuit.DEFAULT_NAME:
         pb_circuit.name = circuit.name
     pb_circuit.n_mode = circuit.m
     comp_serializer = ComponentSerializer()
     for r, c in circuit._components:
-        pb_circuit.components.extend([comp_serializer.serialize(r[0], c)])
+        # Serialize in place in the repeated field, rather than copying a standalone message in it
+        comp_serializer.serialize(r[0], c, pb_circuit.components.add())
     return pb_circuit
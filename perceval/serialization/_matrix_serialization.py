@@ -38,25 +38,18 @@ def serialize_matrix(m: Matrix) -> pb.Matrix:
     pb_mat = pb.Matrix()
     pb_mat.rows = m.shape[0]
     pb_mat.cols = m.shape[1]
-    values = []
     if m.is_symbolic():
-        pb_symbolic = pb.MatrixSymbolic()
+        pb_symbolic = pb_mat.symbolic
+        pb_symbolic.SetInParent()
         for x in m.vec():
-            pb_param = pb.Parameter()
-            pb_param.expression = str(x)
-            values.append(pb_param)
-        pb_symbolic.data.extend(values)
-        pb_mat.symbolic.CopyFrom(pb_symbolic)
+            pb_symbolic.data.add().expression = str(x)
     else:
-        pb_numeric = pb.MatrixDouble()
-        values = []
-        for x in np.nditer(m):
-            pb_complex = pb.ComplexDouble()
-            pb_complex.real_value = float(x.real)
-            pb_complex.imaginary_value = float(x.imag)
-            values.append(pb_complex)
-        pb_numeric.data.extend(values)
-        pb_mat.numeric.CopyFrom(pb_numeric)
+        pb_numeric = pb_mat.numeric
+        pb_numeric.SetInParent()
+        add_value = pb_numeric.data.add
+        # Row-major Python complex values, built in bulk by numpy rather than scalar per scalar
+        for x in np.asarray(m, dtype=complex).ravel().tolist():
+            add_value(real_value=x.real, imaginary_value=x.imag)
     return pb_mat
 
 
@@ -167,4 +167,4 @@ def serialize(obj, compress=False) -> object:
 def serialize_to_file(obj, filepath: str, compress=False) -> None:
     serial_repr = serialize(obj, compress=compress)
     with open(filepath, mode="w") as f:
-        f.write(json.dumps(serial_repr))
+        json.dump(serial_repr, f)  # Streams the JSON encoding to the file, instead of building it in memory first
@@ -28,9 +28,11 @@
 # SOFTWARE.
 
 import math
+import random
 import time
 import sys
 
+from itertools import accumulate
 from typing import Callable, Dict, Tuple
 
 from perceval.backends import ASamplingBackend
@@ -98,6 +100,8 @@ class NoisySamplingSimulator:
     :param sampling_backend: Instance of a sampling-capable back-end
     """
 
+    _MIN_ACCEPTANCE_ESTIMATE = 0.05  # Floor of the acceptance rate used to size input batches
+
     def __init__(self, sampling_backend: ASamplingBackend):
         self._backend = sampling_backend
         self._min_detected_photons_filter = 0
@@ -224,10 +228,32 @@ class NoisySamplingSimulator:
         not_selected = 0
         selected_inputs = []
         shots = 0
+
+        # Hoist loop invariants out of the per-shot loop
+        min_detected_photons = self._min_detected_photons_filter
+        threshold_detector = self._threshold_detector
+        state_selected = self._state_selected
+        sample_from = provider.sample_from
+        herald_modes = list(self._heralds.keys()) if self._heralds and not self._keep_heralds else None
+        # Input states were already filtered on photon count by _preprocess_input_state, draw them from cumulated
+        # weights computed once rather than at each batch
+        input_states = list(noisy_input.keys())
+        input_cum_weights = list(accumulate(noisy_input.values()))
+        if not input_states:
+            raise RuntimeError("No state to sample from")
+
+        batch_size = max_samples
         while len(output) < max_samples and (max_shots is None or shots < max_shots):
             if idx == len(selected_inputs):
                 idx = 0
-                selected_inputs = noisy_input.sample(max_samples, non_null=False)
+                if shots:
+                    # Size the next batch of inputs from the acceptance rate observed so far, growing at most 2x
+                    acceptance = max(len(output) / shots, self._MIN_ACCEPTANCE_ESTIMATE)
+                    expected_shots = math.ceil((max_samples - len(output)) / acceptance)
+                    batch_size = min(2 * batch_size, max(batch_size, expected_shots))
+                if max_shots is not None:
+                    batch_size = min(batch_size, max_shots - shots)
+                selected_inputs = random.choices(input_states, cum_weights=input_cum_weights, k=batch_size)
             selected_bs = selected_inputs[idx]
             idx += 1
 
@@ -236,24 +262,24 @@ class NoisySamplingSimulator:
                 bs_list = selected_bs.separate_state(keep_annotations=False)
                 sampled_components = []
                 for bs in bs_list:
-                    sampled_components.append(provider.sample_from(bs))
+                    sampled_components.append(sample_from(bs))
                 sampled_state = sampled_components.pop()
                 for component in sampled_components:
                     sampled_state = sampled_state.merge(component)
             else:
-                sampled_state = provider.sample_from(selected_bs)
+                sampled_state = sample_from(selected_bs)
 
-            if self._threshold_detector:
+            if threshold_detector:
                 sampled_state = sampled_state.threshold_detection()
 
             # Post-processing
             shots += 1
-            if sampled_state.n < self._min_detected_photons_filter:
+            if sampled_state.n < min_detected_photons:
                 not_selected_physical += 1
                 continue
-            if self._state_selected(sampled_state):
-                if self._heralds and not self._keep_heralds:  # Remove ancillary modes
-                    sampled_state = sampled_state.remove_modes(list(self._heralds.keys()))
+            if state_selected(sampled_state):
+                if herald_modes:  # Remove ancillary modes
+                    sampled_state = sampled_state.remove_modes(herald_modes)
                 output.append(sampled_state)
             else:
                 not_selected += 1
@@ -79,7 +79,7 @@ class SimulatorFactory:
                 post_select = circuit.post_select_fn
                 heralds = circuit.heralds
                 if circuit._is_unitary:
-                    circuit = circuit.linear_circuit()
+                    circuit = circuit._get_linear_circuit()
                 else:
                     circuit = circuit.components
 
@@ -27,9 +27,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Callable, Tuple, Union
+from typing import Callable, Iterable, Iterator, Tuple, Union
 
 import exqalibur as xq
+import numpy as np
 from perceval.components import ACircuit, Circuit, GenericInterferometer, BS, PS, catalog
 from perceval.utils import Matrix, P
 from perceval.utils.logging import get_logger, channel
@@ -52,7 +53,6 @@ class CircuitOptimizer:
     :param ntrials: Number of optimization trials (default 4)
     :param max_eval_per_trial: maximum number of evaluations per optimization trial (default 200000)
     """
-
     def __init__(self, threshold: float = 1e-6, ntrials: int = 4, max_eval_per_trial: int = 200000):
 
         self.threshold = threshold
@@ -86,13 +86,13 @@ class CircuitOptimizer:
         self._max_eval_per_trial = value
 
     def optimize(self,
-                 target: Union[ACircuit, Matrix],
+                 target: Union[ACircuit, Matrix, np.ndarray],
                  template: ACircuit
                  ) -> Tuple[ACircuit, float]:
         """
         Optimize a template circuit unitary's fidelity with a target matrix or circuit.
 
-        :param target: The target unitary circuit or matrix
+        :param target: The target unitary circuit or matrix (a numpy array is accepted as well)
         :param template: A circuit with variable parameters (supports only beam splitters and phase shifters)
         :return: A tuple of the best optimized circuit and its fidelity to the target
 
@@ -104,20 +104,70 @@ class CircuitOptimizer:
         >>> random_unitary = Matrix.random_unitary(12)
         >>> result_circuit, fidelity = CircuitOptimizer().optimize(random_unitary, template)
         """
-        if isinstance(target, ACircuit):
-            target = target.compute_unitary()
+        return self._optimize_serialized(target, template.m, serialize_binary(template))
+
+    def optimize_many(self,
+                      targets: Iterable[Union[ACircuit, Matrix, np.ndarray]],
+                      template: ACircuit
+                      ) -> Iterator[Tuple[ACircuit, float]]:
+        """
+        Optimize a template circuit unitary's fidelity with each of the targets, in turn.
 
-        if template.m != target.shape[0]:
-            raise ValueError(f"Template circuit and target size should be the same ({template.m} != {target.shape[0]})")
+        The template is serialized only once for all targets, which are consumed lazily.
 
-        if target.is_symbolic():
-            raise TypeError("Target must be numeric")
+        :param targets: An iterable of target unitary circuits or matrices
+        :param template: A circuit with variable parameters (supports only beam splitters and phase shifters)
+        :return: An iterator over the tuples (best optimized circuit, fidelity), in the order of the targets
+        """
+        serialized_template = serialize_binary(template)
+        for target in targets:
+            yield self._optimize_serialized(target, template.m, serialized_template)
+
+    def _optimize_serialized(self,
+                             target: Union[ACircuit, Matrix, np.ndarray],
+                             m: int,
+                             serialized_template: bytes
+                             ) -> Tuple[ACircuit, float]:
+        if isinstance(target, ACircuit):
+            target = target.compute_unitary()
 
-        optimizer = xq.CircuitOptimizer(target, serialize_binary(template))
-        optimizer.set_max_eval_per_trial(self._max_eval_per_trial)
-        optimizer.set_threshold(self._threshold)
-        optimized_circuit = deserialize_circuit(optimizer.optimize(self._trials))
-        return optimized_circuit, optimizer.fidelity
+        if m != target.shape[0]:
+            raise ValueError(f"Template circuit and target size should be the same ({m} != {target.shape[0]})")
+
+        if isinstance(target, Matrix) and target.is_symbolic():
+            if not target.defined:
+                raise TypeError("Target must be numeric")
+            target = target.tonp()  # A symbolic matrix without free symbols can be evaluated once and for all
+
+        # The optimizer reads the target buffer as is: only C-contiguous complex matrices are accepted, and they are not
+        # copied (e.g. a transposed matrix view needs to be made contiguous first)
+        if target.dtype != np.complex128 or not target.flags.c_contiguous:
+            get_logger().warn("Target is copied to a C-contiguous complex matrix before optimization, "
+                              "pass it in this layout to avoid the copy", channel.user)
+            target = np.ascontiguousarray(target, dtype=np.complex128)
+
+        # Run trials one by one, and stop as soon as one reaches the fidelity threshold. An optimizer instance cannot
+        # be reused after a trial, so each trial gets its own.
+        best_fidelity = None
+        best_serialized_circuit = None
+        error = None
+        for _ in range(self._trials):
+            optimizer = xq.CircuitOptimizer(target, serialized_template)
+            optimizer.set_max_eval_per_trial(self._max_eval_per_trial)
+            optimizer.set_threshold(self._threshold)
+            try:
+                serialized_circuit = optimizer.optimize(1)
+            except RuntimeError as e:  # This trial did not converge, the next ones still may
+                error = e
+                continue
+            if best_fidelity is None or optimizer.fidelity > best_fidelity:
+                best_fidelity = optimizer.fidelity
+                best_serialized_circuit = serialized_circuit
+            if best_fidelity >= 1 - self._threshold:
+                break
+        if best_serialized_circuit is None:
+            raise error
+        return deserialize_circuit(best_serialized_circuit), best_fidelity
 
     def optimize_rectangle(self,
                            target: Matrix,
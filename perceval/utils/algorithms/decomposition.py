@@ -82,6 +82,9 @@ def decompose_triangle(u,
     cU = component.U
     cU_inv = cU.inv()
     cU_inv.simplify()
+    # Compile the cell equation once: each cell only changes the numerical values of the matrix being reduced
+    u_a, u_b = sp.Dummy(), sp.Dummy()
+    f_cell = sp.lambdify([params_symbols, u_a, u_b], [cU_inv[0, 0] * u_a + cU_inv[0, 1] * u_b], modules=[np, scp])
 
     list_components = []
     for j in range(m - 1, 0, -1):
@@ -105,9 +108,7 @@ def decompose_triangle(u,
                         solve_cell = True
                         break
             if not solve_cell:
-                equation = cU_inv[0, 0] * u[n, j] + cU_inv[0, 1] * u[n + 1, j]
-                f = sp.lambdify([params_symbols], [equation], modules=[np, scp])
-                g = lambda *p: np.real(np.abs(f(*p)))
+                g = lambda p, a=u[n, j], b=u[n + 1, j]: np.real(np.abs(f_cell(p, a, b)))
                 x0 = [p.random() for p in params]
                 # look for a constraint solution first
                 res = None
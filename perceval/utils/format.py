@@ -29,6 +29,9 @@
 
 import sympy as sp
 
+# Remarkable multipliers looked for by simple_float, along with their numerical values
+_REMARKABLE_MULTIPLIERS = tuple((m, float(m)) for m in [sp.S(1), sp.pi, sp.sqrt(2), sp.sqrt(3), sp.sqrt(5), sp.sqrt(6)])
+
 
 def simple_float(alpha, precision=1e-6, nsimplify=True, fracmax=63, multiplier=1, mult10=None):
     r"""
@@ -43,10 +46,12 @@ def simple_float(alpha, precision=1e-6, nsimplify=True, fracmax=63, multiplier=1
         alpha = -alpha
     # look for n/p*pi or n/p
     if nsimplify:
+        # The search runs on floats: sympy objects are only built for the simplified value, once found
+        f_alpha = float(alpha)
         for r in range(1, fracmax):
-            for multiplier2 in [sp.S(1), sp.pi, sp.sqrt(2), sp.sqrt(3), sp.sqrt(5), sp.sqrt(6)]:
-                v = alpha/multiplier2*r
-                if abs(float(v)-round(float(v))) < precision:
+            for multiplier2, f_multiplier2 in _REMARKABLE_MULTIPLIERS:
+                v = f_alpha/f_multiplier2*r
+                if abs(v-round(v)) < precision:
                     simple = sign*sp.Rational(round(v), r)*multiplier*multiplier2
                     return simple, str(simple)
     if mult10 is None:
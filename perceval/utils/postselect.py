@@ -65,6 +65,7 @@ class PostSelect:
 
     def __init__(self, str_repr: str = None):
         self._conditions = {}
+        self._flat_conditions = None
         condition_count = 0
         if str_repr:
             try:
@@ -115,18 +116,26 @@ class PostSelect:
         if operator not in self._conditions:
             self._conditions[operator] = []
         self._conditions[operator].append((indexes, value))
+        self._flat_conditions = None
+
+    def _get_flat_conditions(self) -> Tuple[Tuple[Callable, Tuple[int, ...], int], ...]:
+        # (operator, indexes, value) triplets, flattened once to keep dict lookups out of the per-state check
+        if self._flat_conditions is None:
+            self._flat_conditions = tuple((operator, indexes, value)
+                                          for operator, cond in self._conditions.items()
+                                          for indexes, value in cond)
+        return self._flat_conditions
 
     def __call__(self, state: BasicState) -> bool:
         """PostSelect is callable, with a `post_select(BasicState) -> bool` signature.
         Returns `True` if the input state validates all conditions, returns `False` otherwise.
         """
-        for operator, cond in self._conditions.items():
-            for indexes, value in cond:
-                s = 0
-                for i in indexes:
-                    s += state[i]
-                if not operator(s, value):
-                    return False
+        for operator, indexes, value in self._get_flat_conditions():
+            s = 0
+            for i in indexes:
+                s += state[i]
+            if not operator(s, value):
+                return False
         return True
 
     def __repr__(self):
@@ -140,6 +149,12 @@ class PostSelect:
     def __eq__(self, other):
         return self._conditions == other._conditions
 
+    def __copy__(self):
+        # Condition lists are updated in place (e.g. by shift_modes) and must not be shared between copies
+        output = PostSelect()
+        output._conditions = {operator: list(cond) for operator, cond in self._conditions.items()}
+        return output
+
     @property
     def has_condition(self) -> bool:
         """Returns True if at least one condition is defined"""
@@ -148,6 +163,7 @@ class PostSelect:
     def clear(self):
         """Clear all existing conditions"""
         self._conditions.clear()
+        self._flat_conditions = None
 
     def apply_permutation(self, perm_vector: List[int], first_mode: int = 0):
         """
@@ -157,17 +173,11 @@ class PostSelect:
         :param first_mode: First mode of the permutation to apply (default 0)
         :return: A PostSelect with the permutation applied
         """
+        mode_map = {first_mode + i: first_mode + p for i, p in enumerate(perm_vector)}
         output = PostSelect()
         for operator, cond in self._conditions.items():
-            output._conditions[operator] = []
-            for (indexes, value) in cond:
-                new_indexes = []
-                for i in indexes:
-                    if i < first_mode or i >= first_mode + len(perm_vector):
-                        new_indexes.append(i)
-                    else:
-                        new_indexes.append(first_mode + perm_vector[i - first_mode])
-                output._conditions[operator].append((tuple(new_indexes), value))
+            output._conditions[operator] = [(tuple(mode_map.get(i, i) for i in indexes), value)
+                                            for indexes, value in cond]
         return output
 
     def shift_modes(self, shift: int):
@@ -181,6 +191,7 @@ class PostSelect:
                 assert min(indexes) + shift >= 0, f"A shift of {shift} would lead to negative mode# on {self}"
                 new_indexes = tuple(i + shift for i in indexes)
                 cond[c] = (new_indexes, value)
+        self._flat_conditions = None
 
     def can_compose_with(self, modes: List[int]) -> bool:
         """
@@ -222,6 +233,20 @@ def postselect_independent(ps1: PostSelect, ps2: PostSelect) -> bool:
     return True
 
 
+def _herald_lookup(heralds: dict = None) -> Tuple[Tuple[Tuple[int, int], ...], List[int]]:
+    # Herald (mode, value) pairs and mode list, built once instead of for every filtered state
+    if not heralds:
+        return (), []
+    return tuple(heralds.items()), list(heralds.keys())
+
+
+def _heralds_ok(state: BasicState, herald_items: Tuple[Tuple[int, int], ...]) -> bool:
+    for m, v in herald_items:
+        if state[m] != v:
+            return False
+    return True
+
+
 def post_select_distribution(
         bsd: BSDistribution,
         postselect: PostSelect,
@@ -231,18 +256,13 @@ def post_select_distribution(
         bsd.normalize()
         return bsd, 1
 
-    if heralds is None:
-        heralds = {}
+    herald_items, herald_modes = _herald_lookup(heralds)
     logical_perf = 1
     result = BSDistribution()
     for state, prob in bsd.items():
-        heralds_ok = True
-        for m, v in heralds.items():
-            if state[m] != v:
-                heralds_ok = False
-        if heralds_ok and postselect(state):
+        if _heralds_ok(state, herald_items) and postselect(state):
             if not keep_heralds:
-                state = state.remove_modes(list(heralds.keys()))
+                state = state.remove_modes(herald_modes)
             result[state] = prob
         else:
             logical_perf -= prob
@@ -259,18 +279,13 @@ def post_select_statevector(
         sv.normalize()
         return sv, 1
 
-    if heralds is None:
-        heralds = {}
+    herald_items, herald_modes = _herald_lookup(heralds)
     logical_perf = 1
     result = StateVector()
     for state, ampli in sv:
-        heralds_ok = True
-        for m, v in heralds.items():
-            if state[m] != v:
-                heralds_ok = False
-        if heralds_ok and postselect(state):
+        if _heralds_ok(state, herald_items) and postselect(state):
             if not keep_heralds:
-                state = state.remove_modes(list(heralds.keys()))
+                state = state.remove_modes(herald_modes)
             result += ampli*state
         else:
             logical_perf -= abs(ampli)**2
@@ -95,12 +95,12 @@ class ProbabilityDistribution(defaultdict, ABC):
         super().__init__(float)
 
     def normalize(self):
-        sum_probs = sum(list(self.values()))
+        sum_probs = sum(self.values())
         if sum_probs == 0:
             get_logger().warn("Unable to normalize a distribution with only null probabilities", channel.user)
             return
-        for sv in self.keys():
-            self[sv] /= sum_probs
+        # Keys are already in the distribution: bypass the key checks of the subclasses' __getitem__/__setitem__
+        dict.update(self, {state: prob / sum_probs for state, prob in self.items()})
 
     def add(self, obj, proba: float):
         if proba > global_params['min_p']:
@@ -183,9 +183,8 @@ class SVDistribution(ProbabilityDistribution):
         return new_svd
 
     def normalize(self):
-        sum_probs = sum(list(self.values()))
-        for sv in self.keys():
-            self[sv] /= sum_probs
+        sum_probs = sum(self.values())
+        dict.update(self, {sv: prob / sum_probs for sv, prob in self.items()})
 
     def sample(self, count: int, non_null: bool = True) -> List[StateVector]:
         r""" Generate a sample StateVector from the `SVDistribution`
@@ -1,12 +1,10 @@
 import setuptools
-from os.path import dirname
-from glob import glob
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
 # Package list is autogenerated to be any 'perceval' subfolder containing a __init__.py file
-package_list = [dirname(p).replace('\\', '.') for p in glob('perceval/**/__init__.py', recursive=True)]
+package_list = setuptools.find_packages(include=["perceval", "perceval.*"])
 
 setuptools.setup(
     name="perceval-quandela",
@@ -0,0 +1,79 @@
+# MIT License
+#
+# Copyright (c) 2022 Quandela
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# As a special exception, the copyright holders of exqalibur library give you
+# permission to combine exqalibur with code included in the standard release of
+# Perceval under the MIT license (or modified versions of such code). You may
+# copy and distribute such a combined system following the terms of the MIT
+# license for both exqalibur and Perceval. This exception for the usage of
+# exqalibur is limited to the python bindings used by Perceval.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from perceval.components import PS
+from perceval.components.component_catalog import Catalog, CatalogItem
+from perceval.components.core_catalog import catalog_manifest
+
+CORE_CATALOG_PATH = 'perceval.components.core_catalog'
+
+
+def test_catalog_lazy_loading():
+    catalog = Catalog(CORE_CATALOG_PATH)
+    assert catalog.list() == list(catalog_manifest.keys())
+    assert catalog._pending.keys() == catalog_manifest.keys()
+
+    assert "postprocessed cnot" in catalog
+    assert "postprocessed cnot" in catalog._pending  # Membership test does not load the item
+
+    item = catalog["postprocessed cnot"]
+    assert isinstance(item, CatalogItem)
+    assert item.name == "postprocessed cnot"
+    assert "postprocessed cnot" not in catalog._pending
+    assert catalog["postprocessed cnot"] is item
+    assert catalog.list() == list(catalog_manifest.keys())
+
+    with pytest.raises(KeyError):
+        catalog["not in catalog"]
+
+
+def test_catalog_eager_import(monkeypatch):
+    monkeypatch.setenv('EAGER_IMPORT', '1')
+    catalog = Catalog(CORE_CATALOG_PATH)
+    assert not catalog._pending
+    for name in catalog.list():
+        assert catalog[name].name == name
+
+
+def test_postprocessed_cnot_build_circuit_copies():
+    item = Catalog(CORE_CATALOG_PATH)["postprocessed cnot"]
+    c1 = item.build_circuit()
+    expected_u = c1.compute_unitary()
+    expected_x_grids = [c._x_grid for _, c in c1]
+
+    c1.add(0, PS(1.0))
+    c1.inverse(h=True)
+    c2 = item.build_circuit()
+    assert c2 is not c1
+    assert c2.ncomponents() == c1.ncomponents() - 1
+    assert np.allclose(c2.compute_unitary(), expected_u)
+    assert [c._x_grid for _, c in c2] == expected_x_grids
@@ -32,8 +32,13 @@ from perceval.utils.algorithms.circuit_optimizer import CircuitOptimizer
 from perceval.utils.algorithms import norm
 from perceval.components import BS, PS, Circuit, GenericInterferometer
 from perceval.utils import P, Matrix
+from perceval.utils.logging import ExqaliburLogger
 
+import numpy
 import pytest
+from unittest.mock import patch
+
+from _test_utils import LogChecker
 
 
 perfect_theta = BS.r_to_theta(r=.5)
@@ -88,3 +93,84 @@ def test_circuit_optimizer_max_eval_convergence(nb_iteration: int, expected_succ
     except:
         pass
     assert success == expected_success
+
+
+def test_circuit_optimizer_template_modified_in_place():
+    template = Circuit(3) // PS(P("a")) // BS.H() // (1, PS(P("b")))
+    target = Circuit(3) // PS(0.7) // BS.H() // (1, PS(1.1))
+    target.inverse(v=True)
+    circuit_optimizer = CircuitOptimizer()
+    _, fidelity = circuit_optimizer.optimize(target, template)
+    assert 1 - fidelity > circuit_optimizer.threshold  # The template acts on the wrong modes
+
+    # Mirroring the template keeps its number of components and parameter values, but not its structure
+    template.inverse(v=True)
+    result_circuit, fidelity = circuit_optimizer.optimize(target, template)
+    assert 1 - fidelity < circuit_optimizer.threshold
+    assert norm.fidelity(result_circuit.compute_unitary(), target.compute_unitary()) == pytest.approx(fidelity)
+
+
+@patch.object(ExqaliburLogger, "warn")
+def test_circuit_optimizer_non_contiguous_target(mock_warn):
+    def mzi(i):
+        return Circuit(2) // PS(P(f"phi_1_{i}")) // BS.Rx(perfect_theta) \
+            // PS(P(f"phi_2_{i}")) // BS.Rx(perfect_theta)
+
+    template = GenericInterferometer(4, mzi, phase_shifter_fun_gen=_ps, phase_at_output=True)
+    circuit_optimizer = CircuitOptimizer()
+    target = Matrix.random_unitary(4)
+    with LogChecker(mock_warn, expected_log_number=0):
+        circuit_optimizer.optimize(target, template)
+
+    target = target.T  # Transposition returns a Fortran-ordered view, which has to be copied
+    with LogChecker(mock_warn):
+        result_circuit, fidelity = circuit_optimizer.optimize(target, template)
+    assert norm.fidelity(result_circuit.compute_unitary(), target) == pytest.approx(fidelity)
+
+
+def test_circuit_optimizer_target_modified_in_place():
+    def mzi(i):
+        return Circuit(2) // PS(P(f"phi_1_{i}")) // BS.Rx(perfect_theta) \
+            // PS(P(f"phi_2_{i}")) // BS.Rx(perfect_theta)
+
+    template = GenericInterferometer(3, mzi, phase_shifter_fun_gen=_ps, phase_at_output=True)
+    target = Circuit(3) // BS() // PS(0.4) // (1, BS.H()) // (1, PS(1.3))
+    circuit_optimizer = CircuitOptimizer()
+    circuit_optimizer.optimize(target, template)
+
+    # Neither the number of components nor the parameter values change, but the unitary does
+    target.inverse(h=True)
+    result_circuit, fidelity = circuit_optimizer.optimize(target, template)
+    assert 1 - fidelity < circuit_optimizer.threshold
+    assert norm.fidelity(result_circuit.compute_unitary(), target.compute_unitary()) == pytest.approx(fidelity)
+
+
+def test_circuit_optimizer_target_types():
+    def mzi(i):
+        return Circuit(2) // PS(P(f"phi_1_{i}")) // BS.Rx(perfect_theta) \
+            // PS(P(f"phi_2_{i}")) // BS.Rx(perfect_theta)
+
+    template = GenericInterferometer(2, mzi, phase_shifter_fun_gen=_ps, phase_at_output=True)
+    circuit_optimizer = CircuitOptimizer()
+    numeric_target = BS.H().compute_unitary()
+    for target in [numpy.array(numeric_target), Matrix(numeric_target, use_symbolic=True)]:
+        _, fidelity = circuit_optimizer.optimize(target, template)
+        assert 1 - fidelity < circuit_optimizer.threshold
+
+    with pytest.raises(TypeError):
+        circuit_optimizer.optimize(BS(theta=P("theta")).U, template)
+
+
+def test_circuit_optimizer_optimize_many():
+    def mzi(i):
+        return Circuit(2) // PS(P(f"phi_1_{i}")) // BS.Rx(perfect_theta) \
+            // PS(P(f"phi_2_{i}")) // BS.Rx(perfect_theta)
+
+    template = GenericInterferometer(3, mzi, phase_shifter_fun_gen=_ps, phase_at_output=True)
+    circuit_optimizer = CircuitOptimizer()
+    targets = [Matrix.random_unitary(3) for _ in range(3)]
+    results = list(circuit_optimizer.optimize_many(iter(targets), template))
+    assert len(results) == len(targets)
+    for target, (result_circuit, fidelity) in zip(targets, results):
+        assert 1 - fidelity < circuit_optimizer.threshold
+        assert norm.fidelity(result_circuit.compute_unitary(), target) == pytest.approx(fidelity)
@@ -87,6 +87,15 @@ def test_noisy_sampling():
     assert sampling['results'].total() == 100
 
 
+def test_noisy_sampling_no_input_left():
+    sim = _build_noisy_simulator(3)
+    source = Source(losses=0.5)
+    input_state = source.generate_distribution(BasicState([1, 1, 0]))
+    sim.set_min_detected_photons_filter(3)  # Filters out every input state
+    with pytest.raises(RuntimeError, match="No state to sample from"):
+        sim.samples(input_state, 10)
+
+
 def test_noisy_sampling_with_heralds():
     sim = _build_noisy_simulator(6)
     source = Source(losses=0.8, indistinguishability=0.75, multiphoton_component=0.05)
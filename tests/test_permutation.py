@@ -64,8 +64,10 @@ def test_permutation_inverse():
     perm_vector = [4, 1, 3, 5, 2, 0]
     perm = comp.PERM(perm_vector)
     assert perm.perm_vector == perm_vector
+    assert perm.inverse_perm_vector == [perm_vector.index(i) for i in range(len(perm_vector))]
     perm.inverse(h=True)
     assert perm.perm_vector == [perm_vector.index(i) for i in range(len(perm_vector))]
+    assert perm.inverse_perm_vector == perm_vector
     perm.inverse(h=True)  # Get back to the initial state
     assert perm.perm_vector == perm_vector
     perm.inverse(v=True)
@@ -96,6 +96,18 @@ def test_postselect_usage_advanced_ge_le():
         assert not ps4(bs)
 
 
+def test_postselect_usage_after_update():
+    ps = PostSelect("[0]==1")
+    assert ps(BasicState([1, 0, 0]))
+    ps.gt(2, 0)
+    assert not ps(BasicState([1, 0, 0]))
+    assert ps(BasicState([1, 0, 1]))
+    ps.shift_modes(1)
+    assert ps(BasicState([0, 1, 0, 1]))
+    ps.clear()
+    assert ps(BasicState([0, 0, 0, 0]))
+
+
 def test_postselect_str():
     ps1 = PostSelect("[0]==0 & [1, 2 ]>0 & [3, 4]==1 & [5]<1")
     ps2 = PostSelect(str(ps1))
@@ -127,6 +139,7 @@ def test_postselect_shift_modes():
 
     ps.shift_modes(2)
     assert ps == PostSelect("[2,3]==1 & [4,5]>2 & [6,7]<3")
+    assert initial_ps == PostSelect("[0,1]==1 & [2,3]>2 & [4,5]<3")  # The copy does not share its conditions
 
     ps.shift_modes(-2)
     assert ps == initial_ps
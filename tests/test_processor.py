@@ -33,7 +33,7 @@ from unittest.mock import patch
 
 import perceval as pcvl
 from perceval.components import Circuit, Processor, BS, Source, catalog, UnavailableModeException, Port, PortLocation, \
-    PS, PERM
+    PS, PERM, Herald
 from perceval.utils import BasicState, StateVector, SVDistribution, Encoding, NoiseModel
 from perceval.backends import Clifford2017Backend
 
@@ -274,6 +274,79 @@ def test_add_remove_ports():
         assert processor.get_output_port(i) is None
 
 
+def test_heralds_follow_port_changes():
+    processor = Processor("SLOS", 4)
+    assert processor.heralds == {}
+    processor.add_herald(3, 1)
+    assert processor.heralds == {3: 1}
+    assert isinstance(processor.get_output_port(3), Herald)
+
+    processor_copy = processor.copy()
+    processor_copy.add_herald(4, 0)
+    assert processor_copy.heralds == {3: 1, 4: 0}
+    assert processor.heralds == {3: 1}
+    assert processor.get_output_port(4) is None
+
+    processor.remove_port(3)
+    assert processor.heralds == {}
+    assert processor_copy.heralds == {3: 1, 4: 0}
+
+    # Modifying the returned dict does not change the processor heralds
+    heralds = processor_copy.heralds
+    heralds[1] = 1
+    assert processor_copy.heralds == {3: 1, 4: 0}
+
+
+def test_copy_does_not_share_postselect_and_parameters():
+    processor = Processor("SLOS", 6)
+    processor.set_postselection(pcvl.PostSelect("[5]==1"))
+    processor.set_parameter("p", 1)
+
+    processor_copy = processor.copy()
+    processor_copy.add(0, catalog["postprocessed cnot"].build_processor())
+    processor_copy.set_parameter("q", 2)
+    assert processor.post_select_fn == pcvl.PostSelect("[5]==1")
+    assert processor.parameters == {"p": 1}
+    assert processor_copy.post_select_fn != processor.post_select_fn
+    assert processor_copy.parameters == {"p": 1, "q": 2}
+
+
+def test_linear_circuit_cache():
+    p = Processor("SLOS", 2)
+    p.add(0, BS())
+    c = p._get_linear_circuit()
+    assert p._get_linear_circuit() is c
+    assert p._get_linear_circuit(flatten=True) is not c
+
+    p.add(0, PS(0.5))
+    c2 = p._get_linear_circuit()
+    assert c2 is not c
+    assert c2.ncomponents() == 2
+
+    p_copy = p.copy()
+    assert p_copy._get_linear_circuit() is not c2
+    assert np.allclose(p_copy.linear_circuit().compute_unitary(), c2.compute_unitary())
+
+
+def test_linear_circuit_mutation():
+    p = Processor("SLOS", 2)
+    p.add(0, BS())
+    c = p.linear_circuit()
+    assert c is not p.linear_circuit()
+    c.add(0, PS(1.0))
+    assert p.linear_circuit().ncomponents() == 1
+    assert len(p.components) == 1
+
+
+def test_available_commands():
+    p = Processor("SLOS", 2)
+    assert p.available_commands == ["probs"]
+    p.available_commands.append("samples")
+    assert p.available_commands == ["probs"]
+    p.backend = Clifford2017Backend()
+    assert p.available_commands == ["samples"]
+
+
 def test_phase_quantization():
     nm = NoiseModel(phase_imprecision=0.1)
     p0 = Processor("SLOS", catalog["mzi phase first"].build_circuit(phi_a=0.596898191919898198,
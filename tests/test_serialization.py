@@ -33,8 +33,10 @@ import sympy as sp
 import numpy
 from perceval import Matrix, P, ACircuit, Circuit, NoiseModel, PostSelect
 from perceval.utils.statevector import BasicState, BSDistribution, BSCount, BSSamples, SVDistribution, StateVector
-from perceval.serialization import serialize, deserialize, serialize_binary, deserialize_circuit, deserialize_matrix
+from perceval.serialization import serialize, deserialize, serialize_binary, deserialize_circuit, deserialize_matrix, \
+    serialize_to_file, deserialize_file
 from perceval.serialization._parameter_serialization import serialize_parameter, deserialize_parameter
+from perceval.serialization._circuit_serialization import serialize_circuit
 import perceval.components.unitary_components as comp
 import json
 
@@ -99,6 +101,22 @@ def test_circuit_serialization():
     _check_circuits_eq(c1, deserialized_c1)
 
 
+def test_circuit_serialization_shared_parameter():
+    phi = P('phi')
+    c = Circuit(2) // comp.PS(phi) // comp.BS(theta=phi) // (1, comp.PS(phi))
+    pb_c = serialize_circuit(c)
+    pb_params = [pb_c.components[0].phase_shifter.phi, pb_c.components[1].beam_splitter.theta,
+                 pb_c.components[2].phase_shifter.phi]
+    assert all(pb_p.symbol == "phi" for pb_p in pb_params)
+
+    # A value set between two serializations has to be taken into account
+    phi.set_value(0.5)
+    pb_c = serialize_circuit(c)
+    pb_params = [pb_c.components[0].phase_shifter.phi, pb_c.components[1].beam_splitter.theta,
+                 pb_c.components[2].phase_shifter.phi]
+    assert all(pb_p.name == "phi" and pb_p.real_value == 0.5 for pb_p in pb_params)
+
+
 def test_circuit_serialization_backward_compat():
     serial_circuits = {
         # Perceval version (key) that generated the serialized representation of a given circuit (value)
@@ -232,6 +250,14 @@ def test_json():
     assert isinstance(d["d"], SVDistribution)
 
 
+def test_file_serialization(tmp_path):
+    filepath = str(tmp_path / "serialized.json")
+    serialize_to_file({"a": BasicState("|1,0>"), "b": Circuit(2) // comp.BS()}, filepath)
+    d = deserialize_file(filepath)
+    assert d["a"] == BasicState("|1,0>")
+    _check_circuits_eq(d["b"], Circuit(2) // comp.BS())
+
+
 def test_binary_serialization():
     c_before = _build_test_circuit()
     bin_serialization = serialize_binary(c_before)
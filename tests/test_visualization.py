@@ -31,15 +31,21 @@ import pytest
 
 import sys
 import sympy as sp
+import xml.etree.ElementTree as ET
 
 import perceval as pcvl
 from perceval import catalog
 from perceval.components.unitary_components import *
 from perceval.components.non_unitary_components import *
-from perceval.rendering.circuit import SymbSkin
+from perceval.components.port import Herald, PortLocation, QuditPort
+from perceval.rendering import Format
+from perceval.rendering.circuit import PhysSkin, SymbSkin
+from perceval.rendering.pdisplay import pdisplay_circuit
 
 from _test_utils import _save_or_check, save_figs
 
+_SVG_NS = "{http://www.w3.org/2000/svg}"
+
 
 def test_svg_dump_phys_bs(tmp_path, save_figs):
     _save_or_check(BS.H(), tmp_path, sys._getframe().f_code.co_name, save_figs)
@@ -379,3 +385,55 @@ def test_svg_dump_circuit_box_bell_state(tmp_path, save_figs,
         circuit_name=fig_name,
         save_figs=save_figs,
         recursive=True)
+
+
+@pytest.mark.parametrize("skin_type, wp_anchor", [(PhysSkin, "start"), (SymbSkin, "middle")])
+def test_svg_text_groups(skin_type, wp_anchor):
+    c = pcvl.Circuit(2) // BS() // (1, WP(0.1, 0.2))
+    svg = pdisplay_circuit(c, output_format=Format.HTML, skin=skin_type()).as_svg()
+    text_groups = {}
+    for group in ET.fromstring(svg).iter(f"{_SVG_NS}g"):
+        texts = [child for child in group if child.tag == f"{_SVG_NS}text"]
+        if "text-anchor" in group.attrib and texts:
+            # Shared style attributes are set once on the group, not on each text
+            assert "font-size" in group.attrib
+            assert all("font-size" not in t.attrib and "text-anchor" not in t.attrib for t in texts)
+            text_groups.setdefault(group.attrib["text-anchor"], []).append([t.text for t in texts])
+
+    assert ["0", "1"] in text_groups["end"]  # Output mode indexes
+    assert ["0", "1"] in text_groups["start"]  # Input mode indexes
+    assert any(len(texts) == 2 and texts[0].startswith("ξ=") and texts[1].startswith("δ=")
+               for texts in text_groups[wp_anchor])  # Wave plate parameters
+
+
+def test_symb_skin_dispatch():
+    skin = SymbSkin()
+    # The most derived registered type wins: Barrier and PERM are Unitary subclasses
+    assert skin.get_width(Unitary(pcvl.Matrix.random_unitary(3))) == 3
+    assert skin.get_width(Barrier(3)) == 1
+    assert skin.get_width(PERM([2, 0, 1])) == 1
+    assert skin.get_shape(Unitary(pcvl.Matrix.random_unitary(3))) == skin.unitary_shape
+    assert skin.get_shape(Barrier(3)) == skin.barrier_shape
+    assert skin.get_shape(PERM([2, 0, 1])) == skin.perm_shape
+    assert skin.get_shape(HWP(0.2)) == skin.hwp_shape  # HWP over WP
+
+    herald = Herald(1)
+    assert skin.get_shape(herald, PortLocation.INPUT) == skin.herald_shape_in
+    assert skin.get_shape(herald, PortLocation.OUTPUT) == skin.herald_shape_out
+    port = QuditPort(2, "q")  # Resolved through Port
+    assert skin.get_shape(port, PortLocation.INPUT) == skin.port_shape_in
+    assert skin.get_shape(port, PortLocation.OUTPUT) == skin.port_shape_out
+
+    # Unregistered subclasses are resolved once, then memoized per type
+    class CustomBS(BS):
+        pass
+
+    assert skin.get_shape(CustomBS()) == skin.bs_shape
+    assert skin._resolved[(id(SymbSkin._SHAPE_TABLE), CustomBS)] == "bs_shape"
+    skin._resolved[(id(SymbSkin._SHAPE_TABLE), CustomBS)] = "ps_shape"
+    assert skin.get_shape(CustomBS()) == skin.ps_shape
+
+    with pytest.raises(NotImplementedError):
+        skin.get_width(42)
+    with pytest.raises(NotImplementedError):
+        skin.get_shape(BS(), PortLocation.INPUT)  # Not a port